@@ -1,7 +1,32 @@
 """Widget creation strategies."""
 
-from typing import Any, Dict, Type
-from PySide6 import QtWidgets
+from typing import Any, Dict, List, Type
+from PySide6 import QtGui, QtWidgets
+
+# Style sheet placeholder names and the palette roles they stand for. Listed
+# explicitly because the role enum is not iterable on older PySide6 versions.
+PALETTE_ROLES = {
+    'window': 'Window',
+    'window_text': 'WindowText',
+    'base': 'Base',
+    'alternate_base': 'AlternateBase',
+    'tool_tip_base': 'ToolTipBase',
+    'tool_tip_text': 'ToolTipText',
+    'placeholder_text': 'PlaceholderText',
+    'text': 'Text',
+    'button': 'Button',
+    'button_text': 'ButtonText',
+    'bright_text': 'BrightText',
+    'light': 'Light',
+    'midlight': 'Midlight',
+    'dark': 'Dark',
+    'mid': 'Mid',
+    'shadow': 'Shadow',
+    'highlight': 'Highlight',
+    'highlighted_text': 'HighlightedText',
+    'link': 'Link',
+    'link_visited': 'LinkVisited',
+}
 
 
 class QtWidgetStrategy:
@@ -31,11 +56,59 @@ class QtWidgetStrategy:
         Returns:
             QtWidgets.QWidget: Created widget instance
         """
-        if not params:
-            params = {}
+        return self.create_widgets(widget_class, [params])[0]
+    
+    def create_widgets(self, widget_class: Type, params_list: List[Dict[str, Any]]) -> List[QtWidgets.QWidget]:
+        """Create several QWidget instances of the same class.
+        
+        The class style sheet is built once for the batch and applied to each widget.
+        
+        Args:
+            widget_class (Type): Widget class to create
+            params_list (List[Dict[str, Any]]): Parameters of each widget
+            
+        Returns:
+            List[QtWidgets.QWidget]: Created widget instances, None where creation failed
+        """
+        style_sheet = self.build_style_sheet(widget_class)
+        widgets = []
+        for params in params_list:
+            try:
+                widget = widget_class(**(params or {}))
+            except Exception as e:
+                print(f"Error creating widget: {e}")
+                widgets.append(None)
+                continue
+            if style_sheet:
+                widget.setStyleSheet(style_sheet)
+            widgets.append(widget)
+        return widgets
+    
+    def build_style_sheet(self, widget_class: Type) -> str:
+        """Build the style sheet of a widget class.
+        
+        ``STYLE_SHEET`` on the class may use palette role names such as
+        ``{highlight}`` or ``{window_text}``, which are filled in from the
+        application palette.
+        
+        Args:
+            widget_class (Type): Widget class to style
             
+        Returns:
+            str: Style sheet text, empty if the class defines none
+        """
+        template = getattr(widget_class, 'STYLE_SHEET', '')
+        if not template:
+            return ''
+        
+        palette = QtWidgets.QApplication.palette()
+        colors = {}
+        for name, role_name in PALETTE_ROLES.items():
+            role = getattr(QtGui.QPalette, role_name, None)
+            if role is not None:
+                colors[name] = palette.color(role).name()
         try:
-            return widget_class(**params)
-        except Exception as e:
-            print(f"Error creating widget: {e}")
-            return None
+            return template.format_map(colors)
+        except (KeyError, ValueError) as e:
+            print(f"Invalid style sheet of {widget_class.__name__}: {e}")
+            return ''
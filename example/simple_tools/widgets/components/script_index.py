@@ -0,0 +1,412 @@
+"""Persistent, incrementally updated index of script files."""
+
+import os
+import re
+import json
+import bisect
+import string
+import hashlib
+import logging
+import operator
+import threading
+from itertools import accumulate, chain, compress, repeat
+from typing import Callable, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QCoreApplication, QStandardPaths, QThread, Signal
+
+_SKIPPED_DIRS = {'__pycache__', 'node_modules'}
+
+# Characters whose line sets are built up front; others are built on first use
+_INDEXED_CHARS = string.ascii_lowercase + string.digits + '_-. '
+
+
+def default_index_path(roots: Sequence[str]) -> str:
+    """Get the cache file used for a set of root directories."""
+    key = hashlib.sha1("\n".join(sorted(roots)).encode('utf-8')).hexdigest()[:16]
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    return os.path.join(cache_dir, f"script_index_{key}.json")
+
+
+class ScriptIndex:
+    """Index of script files below a set of root directories.
+
+    Each directory is stored with its mtime and its file and subdirectory
+    names. A refresh only lists directories whose mtime changed, so an
+    unchanged tree costs one stat per directory instead of one per file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, roots: Sequence[str], index_path: str, extensions: Sequence[str] = ('.py',)):
+        self.roots = [os.path.normpath(root) for root in roots]
+        self.index_path = index_path
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self._dirs: Dict[str, Dict] = {}
+
+    def load(self) -> bool:
+        """Load the index from disk. Returns False if there was no usable index."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning(f"Failed to load script index {self.index_path}: {e}")
+            return False
+
+        if data.get('version') != self.VERSION or data.get('extensions') != list(self.extensions):
+            return False
+        self._dirs = data.get('dirs', {})
+        return True
+
+    def save(self) -> None:
+        """Write the index to disk."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'extensions': list(self.extensions), 'dirs': self._dirs}, f)
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            logging.warning(f"Failed to save script index {self.index_path}: {e}")
+
+    def refresh(self, should_stop: Callable[[], bool] = lambda: False) -> bool:
+        """Walk the roots and rescan directories whose mtime changed.
+
+        Args:
+            should_stop (Callable[[], bool]): Checked between directories to abort the walk
+
+        Returns:
+            bool: True if the index changed. False if nothing changed or the walk was aborted.
+        """
+        dirs = {}
+        changed = False
+        stack = list(self.roots)
+        while stack:
+            if should_stop():
+                return False
+
+            path = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = self._dirs.get(path)
+            if not entry or entry['mtime'] != mtime:
+                entry = self._scan_dir(path, mtime)
+                if entry is None:
+                    continue
+                changed = True
+
+            dirs[path] = entry
+            stack.extend(os.path.join(path, name) for name in entry['subdirs'])
+
+        changed = changed or len(dirs) != len(self._dirs)
+        self._dirs = dirs
+        return changed
+
+    def _scan_dir(self, path: str, mtime: int) -> Optional[Dict]:
+        """List one directory."""
+        files, subdirs = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIPPED_DIRS:
+                                subdirs.append(entry.name)
+                        elif entry.name.lower().endswith(self.extensions):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return {'mtime': mtime, 'files': files, 'subdirs': subdirs}
+
+    def paths(self) -> List[str]:
+        """Get all indexed file paths."""
+        return [os.path.join(directory, name)
+                for directory, entry in self._dirs.items()
+                for name in entry['files']]
+
+
+class ScriptSearch:
+    """Fuzzy filter over a fixed list of paths.
+
+    Results come in three tiers: the first term of the query in the file name,
+    the first term anywhere in the path, then the first term as a subsequence
+    of the path. Further terms must appear in the path as subsequences. Within
+    a tier shorter paths come first.
+
+    Paths are sorted by length and joined into newline separated strings, so
+    each tier is a regex scan in C that stops once enough results are found.
+    For every character the set of lines containing it is kept as a bitmask,
+    and when the characters of a query rule out most lines, the scans run
+    over the remaining lines only. When a scan runs to the end, the complete
+    set of matches is kept, and a query that extends the previous one only
+    checks those lines again. Scans run in chunks so that a search can be
+    abandoned between them.
+    """
+
+    # Scan the candidate lines instead of all lines below this fraction of lines
+    prefilter_ratio = 0.5
+    # Characters scanned per regex call before checking whether to stop
+    scan_chunk = 1 << 18
+
+    def __init__(self, paths: List[str]):
+        self.paths = sorted(paths, key=lambda path: (len(path), path))
+        self._lower = [path.lower() for path in self.paths]
+        self._names = [os.path.basename(path) for path in self._lower]
+        self._text, self._offsets = self._join(self._lower)
+        self._names_text, self._names_offsets = self._join(self._names)
+        self._char_lines: Dict[str, int] = {}
+        for char in _INDEXED_CHARS:
+            self._lines_with(char)
+        self._cached_query = None
+        self._cached_matches: List[int] = []
+
+    @staticmethod
+    def _join(lines: List[str]):
+        """Join lines with newlines and return the text with the start offset of every line."""
+        offsets = [0]
+        for line in lines:
+            offsets.append(offsets[-1] + len(line) + 1)
+        return "\n".join(lines) + "\n", offsets
+
+    @staticmethod
+    def _join_selected(lines: List[str], flags: bytes):
+        """Join the lines whose flag byte is set, like ``_join``."""
+        selected = list(compress(lines, flags))
+        offsets = list(accumulate(chain([0], (len(line) + 1 for line in selected))))
+        return "\n".join(selected) + "\n", offsets
+
+    def _lines_with(self, char: str) -> int:
+        """Get a bitmask with bit i set if line i contains char, one byte per line."""
+        mask = self._char_lines.get(char)
+        if mask is None:
+            flags = bytes(map(operator.contains, self._lower, repeat(char)))
+            mask = self._char_lines[char] = int.from_bytes(flags, 'little')
+        return mask
+
+    def _candidates(self, query: str) -> Optional[bytes]:
+        """Get one flag byte per line marking lines that contain every character of query.
+
+        Returns None if the characters rule out too few lines to be worth filtering.
+        """
+        mask = -1
+        for char in set(query.replace(' ', '')):
+            mask &= self._lines_with(char)
+        flags = mask.to_bytes(len(self.paths), 'little', signed=True) if mask != -1 else None
+        if flags is None or flags.count(1) > len(self.paths) * self.prefilter_ratio:
+            return None
+        return flags
+
+    @staticmethod
+    def _subsequence(term: str):
+        """Compile a pattern matching the characters of term in order within one line.
+
+        The pattern is anchored at the line start and takes the earliest
+        occurrence of each character, so every line is tried once.
+        """
+        return re.compile('^' + ''.join(f"[^{re.escape(c)}\\n]*{re.escape(c)}" for c in term), re.MULTILINE)
+
+    def search(self, query: str, limit: int = 200,
+               should_stop: Callable[[], bool] = lambda: False) -> Optional[List[str]]:
+        """Get the best matching paths for a query.
+
+        Args:
+            query (str): Filter text
+            limit (int): Maximum number of results
+            should_stop (Callable[[], bool]): Checked between scan chunks to abandon the search
+
+        Returns:
+            Optional[List[str]]: Matching paths, best first, or None if the search was abandoned
+        """
+        query = query.lower()
+        terms = query.split()
+        if not terms:
+            return self.paths[:limit]
+
+        first = terms[0]
+        others = [self._subsequence(term) for term in terms[1:]]
+        fuzzy = self._subsequence(first)
+
+        def accept(index):
+            return all(p.search(self._lower[index]) for p in others)
+
+        if self._cached_query is not None and query.startswith(self._cached_query):
+            # Only lines that matched the shorter query can match this one
+            candidates = [i for i in self._cached_matches if fuzzy.search(self._lower[i]) and accept(i)]
+            self._cached_query, self._cached_matches = query, candidates
+            tiers = ([i for i in candidates if first in self._names[i]],
+                     [i for i in candidates if first in self._lower[i]],
+                     candidates)
+            results = []
+            seen = set()
+            for tier in tiers:
+                for index in tier:
+                    if len(results) >= limit:
+                        break
+                    if index not in seen:
+                        seen.add(index)
+                        results.append(index)
+            return [self.paths[i] for i in results]
+
+        if should_stop():
+            return None
+        flags = self._candidates(query)
+        if flags is None:
+            lines = None
+            text, offsets = self._text, self._offsets
+            names_text, names_offsets = self._names_text, self._names_offsets
+        else:
+            # Scan only the lines containing every character of the query
+            lines = list(compress(range(len(self.paths)), flags))
+            text, offsets = self._join_selected(self._lower, flags)
+            names_text, names_offsets = self._join_selected(self._names, flags)
+
+        literal = re.compile(re.escape(first))
+        results: List[int] = []
+        seen = set()
+        exhausted = False
+        for tier_text, tier_offsets, pattern in ((names_text, names_offsets, literal),
+                                                 (text, offsets, literal),
+                                                 (text, offsets, fuzzy)):
+            pos = 0
+            exhausted = False
+            while len(results) < limit:
+                if should_stop():
+                    return None
+                # Chunks end at a line end, and the text ends with a newline
+                chunk_end = tier_text.find('\n', min(pos + self.scan_chunk, len(tier_text) - 1)) + 1
+                match = pattern.search(tier_text, pos, chunk_end)
+                if not match:
+                    pos = chunk_end
+                    if pos >= len(tier_text):
+                        exhausted = True
+                        break
+                    continue
+                line = bisect.bisect_right(tier_offsets, match.start()) - 1
+                pos = tier_offsets[line + 1]
+                index = line if lines is None else lines[line]
+                if index not in seen and accept(index):
+                    seen.add(index)
+                    results.append(index)
+
+        # The subsequence tier covers the other two, so an exhausted scan found every match
+        if exhausted:
+            self._cached_query, self._cached_matches = query, sorted(results)
+        else:
+            self._cached_query, self._cached_matches = None, []
+        return [self.paths[i] for i in results]
+
+
+class ScriptIndexer(QThread):
+    """Load and refresh a ScriptIndex in a background thread.
+
+    The search structure is built in the thread as well and handed to the GUI
+    thread through ``searchChanged``.
+    """
+
+    searchChanged = Signal(object)
+
+    def __init__(self, roots: Sequence[str], index_path: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.index = ScriptIndex(roots, index_path or default_index_path(roots))
+        self.search = ScriptSearch([])
+        self._loaded = False
+        self.searchChanged.connect(self._set_search)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def _set_search(self, search: ScriptSearch) -> None:
+        self.search = search
+
+    def refresh(self) -> None:
+        """Start an incremental rescan unless one is already running."""
+        if not self.isRunning():
+            self.start()
+
+    def run(self) -> None:
+        # Publish the cached index first, then the refreshed one if anything changed
+        if not self._loaded:
+            self._loaded = True
+            if self.index.load():
+                self.searchChanged.emit(ScriptSearch(self.index.paths()))
+        if self.index.refresh(self.isInterruptionRequested):
+            self.index.save()
+            self.searchChanged.emit(ScriptSearch(self.index.paths()))
+
+    def stop(self) -> None:
+        """Abort the scan and wait for the thread to finish."""
+        self.requestInterruption()
+        self.wait()
+
+
+class ScriptSearcher(QThread):
+    """Run ScriptSearch queries in a background thread.
+
+    Only the latest request is kept: a request replaces one that has not
+    started, and a running search is abandoned once a newer request arrives.
+    Results are delivered to the GUI thread through ``resultsReady``.
+    """
+
+    resultsReady = Signal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._request = None
+        self._stopping = False
+
+    def request(self, search: ScriptSearch, query: str, limit: int) -> None:
+        """Search for a query, superseding any earlier request."""
+        with self._condition:
+            self._request = (search, query, limit)
+            self._condition.notify()
+        if not self.isRunning():
+            self._stopping = False
+            self.start()
+
+    def _superseded(self) -> bool:
+        return self._stopping or self._request is not None
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while self._request is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                search, query, limit = self._request
+                self._request = None
+
+            results = search.search(query, limit, self._superseded)
+            if results is not None:
+                self.resultsReady.emit(query, results)
+
+    def stop(self) -> None:
+        """Abandon the current search and wait for the thread to finish."""
+        with self._condition:
+            self._stopping = True
+            self._request = None
+            self._condition.notify()
+        self.wait()
+
+
+_indexers: Dict[tuple, ScriptIndexer] = {}
+
+
+def get_indexer(roots: Sequence[str], index_path: Optional[str] = None) -> ScriptIndexer:
+    """Get the indexer shared by all launchers with the same roots, starting it on first use."""
+    key = (tuple(roots), index_path)
+    indexer = _indexers.get(key)
+    if indexer is None:
+        indexer = ScriptIndexer(roots, index_path)
+        _indexers[key] = indexer
+        indexer.refresh()
+    return indexer
@@ -0,0 +1,94 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QLineEdit, QListWidget, QVBoxLayout
+
+class ScriptPicker(QDialog):
+    """Dialog that filters indexed scripts as you type.
+
+    Searches run in the searcher's thread, so typing is never blocked by a
+    slow query; results for text that has changed since are dropped.
+    """
+
+    max_results = 200
+
+    def __init__(self, indexer, searcher, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Select Script File")
+        self.resize(700, 450)
+        self.indexer = indexer
+        self.search = indexer.search
+        self.searcher = searcher
+        self.searcher.setParent(self)
+        self.shown_query = None
+        self.setup_ui()
+
+        self.searcher.resultsReady.connect(self.show_results)
+        self.indexer.searchChanged.connect(self.update_search)
+        self.indexer.finished.connect(self.update_status)
+        self.indexer.refresh()
+        self.apply_filter()
+
+    def setup_ui(self):
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Type to filter scripts...")
+        self.result_list = QListWidget()
+        self.status_label = QLabel()
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+
+        # Connect signals
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        self.filter_edit.returnPressed.connect(self.accept)
+        self.result_list.itemDoubleClicked.connect(self.accept)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.result_list)
+        layout.addWidget(self.status_label)
+        layout.addWidget(buttons)
+
+    def keyPressEvent(self, event):
+        # Let the arrow keys move through the results while typing
+        if event.key() in (Qt.Key_Up, Qt.Key_Down):
+            row = self.result_list.currentRow() + (1 if event.key() == Qt.Key_Down else -1)
+            self.result_list.setCurrentRow(max(0, min(row, self.result_list.count() - 1)))
+            return
+        super().keyPressEvent(event)
+
+    def update_search(self, search):
+        self.search = search
+        self.apply_filter()
+
+    def update_status(self):
+        scanning = " (scanning...)" if self.indexer.isRunning() else ""
+        self.status_label.setText(f"{len(self.search.paths)} scripts indexed{scanning}")
+
+    def apply_filter(self):
+        self.shown_query = None
+        self.searcher.request(self.search, self.filter_edit.text(), self.max_results)
+        self.update_status()
+
+    def show_results(self, query, results):
+        if query != self.filter_edit.text():
+            return
+        self.shown_query = query
+        self.result_list.clear()
+        self.result_list.addItems(results)
+        if results:
+            self.result_list.setCurrentRow(0)
+
+    def accept(self):
+        # Enter may be pressed before the results for the current text arrive
+        self.searcher.stop()
+        query = self.filter_edit.text()
+        if self.shown_query != query:
+            self.show_results(query, self.search.search(query, self.max_results))
+        super().accept()
+
+    def done(self, result):
+        self.searcher.stop()
+        super().done(result)
+
+    def selected_path(self):
+        item = self.result_list.currentItem()
+        return item.text() if item else ""
@@ -2,13 +2,43 @@ from PySide6.QtWidgets import QFileDialog, QMessageBox, QLineEdit, QPushButton,
 from PySide6.QtCore import QProcess
 import os
 import sys
+import importlib.util
+
+def import_sibling(name):
+    """Import a module next to this file.
+
+    The widget loader loads this file by path, so the package it lives in may
+    not be importable. Siblings are registered under a fixed name so every
+    launcher shares the same module, including its indexer cache.
+    """
+    module_name = f"scripts_launcher_{name}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[module_name]
+            raise
+    return module
 
 class ScriptsLauncher(QWidget):
-    def __init__(self, default_script_path=""):
+    # Applied by QtWidgetStrategy; palette role names are filled in from the application palette
+    STYLE_SHEET = "QTextEdit {{ border: 1px solid {mid}; }}"
+
+    def __init__(self, default_script_path="", script_roots=None, index_path=None):
         super().__init__()
         self.setup_ui(default_script_path)
         self.process = None
 
+        # Index the configured script directories in the background for the picker
+        self.indexer = None
+        if script_roots:
+            self.indexer = import_sibling("script_index").get_indexer(script_roots, index_path)
+
     def setup_ui(self, default_script_path):
         # Initialize your UI components here
         self.file_path_edit = QLineEdit(default_script_path)
@@ -34,6 +64,16 @@ class ScriptsLauncher(QWidget):
         self.setLayout(main_layout)
 
     def openFile(self):
+        if self.indexer is not None:
+            searcher = import_sibling("script_index").ScriptSearcher()
+            picker = import_sibling("script_picker").ScriptPicker(self.indexer, searcher, self)
+            if picker.exec():
+                file_path = picker.selected_path()
+                if file_path:
+                    self.file_path_edit.setText(file_path)
+            picker.deleteLater()
+            return
+
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Script File",
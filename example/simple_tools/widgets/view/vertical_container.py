@@ -2,22 +2,25 @@
 
 import os
 import logging
-from typing import List
+from typing import List, Optional
 from PySide6 import QtWidgets
-from modular_qtwidgets.widget_loader import WidgetCreationService
+from modular_qtwidgets.service_registry import get_shared_service
+from modular_qtwidgets.instrumentation import WidgetInstrumentation
 
 class VerticalContainerWidget(QtWidgets.QWidget):
     """Main container widget that loads and organizes child widgets vertically."""
     
     _location = "scripts_components"
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, instrumentation: Optional[WidgetInstrumentation] = None):
         """Initialize the container widget.
 
         Args:
             parent (QtWidgets.QWidget, optional): Parent widget.
+            instrumentation (Optional[WidgetInstrumentation]): Records runtime costs of created widgets
         """
         super().__init__(parent)
+        self.instrumentation = instrumentation
         self.item_widgets: List[QtWidgets.QWidget] = []
         self.setup_ui()
         self.load_widgets()
@@ -48,13 +51,15 @@ class VerticalContainerWidget(QtWidgets.QWidget):
             current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             config_path = os.path.join(current_dir, "configs", "simple_tools.yaml")
             
-            # Create widget service
-            service = WidgetCreationService(config_path)
+            # Get the shared widget service
+            service = get_shared_service(config_path)
             
             # Define callback for widget creation
             def on_widget_created(widget: QtWidgets.QWidget, widget_name: str, widget_config: dict):
                 self.container_layout.insertWidget(self.container_layout.count() - 1, widget)
                 self.item_widgets.append(widget)
+                if self.instrumentation is not None:
+                    self.instrumentation.attach(widget, self._location, widget_name)
             
             # Create widgets with callback
             widgets = service.create_widgets_for_location(self._location, on_widget_created)
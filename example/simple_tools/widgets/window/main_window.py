@@ -1,23 +1,45 @@
-from PySide6.QtWidgets import QMainWindow, QApplication
-from ..view.vertical_container import VerticalContainerWidget
+import os
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtWidgets import QMainWindow, QApplication, QTabWidget
+from modular_qtwidgets import LocationHostWidget, IdlePrefetcher, UsageProfile
+from modular_qtwidgets.widget_loader import load_config
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Simple Tools Example")
         self.resize(800, 600)
-        
-        # Create and set the central widget
-        self.central_widget = VerticalContainerWidget()
-        self.setCentralWidget(self.central_widget)
+
+        # Get the config file path
+        current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        config_path = os.path.join(current_dir, "configs", "simple_tools.yaml")
+
+        # Create one tab per location; each tab builds its widgets when first shown
+        self.tab_widget = QTabWidget()
+        self.setCentralWidget(self.tab_widget)
+        self.prefetcher = IdlePrefetcher(parent=self)
+
+        # Build the widgets used most in previous launches first
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+        self.usage_profile = UsageProfile(os.path.join(data_dir, "usage_profile.json"), parent=self)
+
+        groups = load_config(config_path).get('widget_system', {}).get('groups', {})
+        for location in groups:
+            host = LocationHostWidget(config_path, location, usage_profile=self.usage_profile)
+            self.tab_widget.addTab(host, location)
+            self.prefetcher.add_host(host)
+
+    def closeEvent(self, event):
+        self.usage_profile.save()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     # Create the application object
     app = QApplication([])
-    
+
     # Create and show the main window
     window = MainWindow()
     window.show()
-    
+
     # Start the event loop
-    app.exec_()
\ No newline at end of file
+    app.exec_()
@@ -2,9 +2,23 @@
 
 from .widget_loader import WidgetCreationService
 from .widget_strategies import WidgetCreationStrategy
+from .plugins import PluginIndex, get_plugin_index
+from .service_registry import ServiceRegistry, get_shared_service, invalidate_shared_services
+from .instrumentation import WidgetInstrumentation
+from .usage_profile import UsageProfile
+from .location_host import LocationHostWidget, IdlePrefetcher
 
 __version__ = "0.1.0"
 __all__ = [
     'WidgetCreationService',
     'WidgetCreationStrategy',
+    'PluginIndex',
+    'get_plugin_index',
+    'ServiceRegistry',
+    'get_shared_service',
+    'invalidate_shared_services',
+    'WidgetInstrumentation',
+    'UsageProfile',
+    'LocationHostWidget',
+    'IdlePrefetcher',
 ]
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Command line interface: ``python -m modular_qtwidgets check config.yaml``."""
+
+import sys
+
+from .config_check import main
+
+if __name__ == '__main__':
+    sys.exit(main())
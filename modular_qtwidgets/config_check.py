@@ -0,0 +1,464 @@
+"""Validate widget configuration files without starting the application."""
+
+import os
+import io
+import argparse
+import contextlib
+import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .plugins import PluginIndex, STRATEGY_GROUP, WIDGET_GROUP, get_plugin_index
+from .widget_loader import WidgetCreationService, load_config, expand_widget_config, load_module_from_path
+
+Issue = Tuple[str, str, str]
+Task = Tuple[Callable[..., List[Issue]], tuple, List[str]]
+
+# Issues at these places leave the service unable to load the configuration
+_STRUCTURAL = ('widget_system', 'config', 'strategies', 'groups')
+
+_worker_config_path = None
+_worker_plugin_index = None
+_worker_service = None
+_worker_app = None
+_worker_slots = None
+_worker_slot = None
+
+
+def validate_config(widget_config: Dict, plugin_index: Optional[PluginIndex] = None) -> List[Issue]:
+    """Check the structure of a loaded configuration and its strategy bindings.
+
+    Args:
+        widget_config (Dict): Loaded configuration
+        plugin_index (Optional[PluginIndex]): Installed plugins to check ``entry_point`` names against
+
+    Returns:
+        List[Issue]: (level, where, message) tuples, level is "error" or "warning"
+    """
+    if not isinstance(widget_config, dict):
+        return [('error', 'widget_system', "Configuration must be a mapping")]
+    widget_system = widget_config.get('widget_system')
+    if not isinstance(widget_system, dict):
+        return [('error', 'widget_system', "Missing 'widget_system' section")]
+
+    issues = []
+    system_config = widget_system.get('config') or {}
+    if not isinstance(system_config, dict):
+        issues.append(('error', 'config', "'config' must be a mapping"))
+        system_config = {}
+    discover = system_config.get('discover_plugins', True)
+
+    strategies = widget_system.get('strategies')
+    if strategies is None:
+        issues.append(('error', 'strategies', "Missing 'strategies' list"))
+        strategies = []
+    elif not isinstance(strategies, list):
+        issues.append(('error', 'strategies', "'strategies' must be a list"))
+        strategies = []
+
+    installed_strategies = plugin_index.get_entry_points(STRATEGY_GROUP) if plugin_index else {}
+    installed_widgets = plugin_index.get_entry_points(WIDGET_GROUP) if plugin_index else {}
+
+    strategy_names = set()
+    for index, strategy_config in enumerate(strategies):
+        where = f"strategies[{index}]"
+        if not isinstance(strategy_config, dict):
+            issues.append(('error', where, "Strategy entry must be a mapping"))
+            continue
+        fields = ('name', 'entry_point') if strategy_config.get('entry_point') else ('name', 'path', 'class')
+        for field in fields:
+            if not strategy_config.get(field):
+                issues.append(('error', where, f"Missing '{field}'"))
+        if strategy_config.get('name'):
+            where = f"strategies/{strategy_config['name']}"
+            if strategy_config['name'] in strategy_names:
+                issues.append(('error', where, "Duplicate strategy name"))
+            if strategy_config.get('enabled', True):
+                strategy_names.add(strategy_config['name'])
+        if strategy_config.get('path') and not os.path.exists(strategy_config['path']):
+            issues.append(('error', where, f"Strategy module not found: {strategy_config['path']}"))
+        entry_point = strategy_config.get('entry_point')
+        if entry_point and plugin_index and entry_point not in installed_strategies:
+            issues.append(('error', where, f"Strategy entry point not installed: {entry_point}"))
+
+    groups = widget_system.get('groups') or {}
+    if not isinstance(groups, dict):
+        issues.append(('error', 'groups', "'groups' must be a mapping"))
+        groups = {}
+
+    for location, group_config in groups.items():
+        group_config = group_config or {}
+        if not isinstance(group_config, dict):
+            issues.append(('error', location, "Group entry must be a mapping"))
+            continue
+        widgets = group_config.get('widgets') or {}
+        if not isinstance(widgets, dict):
+            issues.append(('error', location, "'widgets' must be a mapping"))
+            continue
+        for widget_name, widget_config in widgets.items():
+            where = f"{location}/{widget_name}"
+            if not isinstance(widget_config, dict):
+                issues.append(('error', where, "Widget entry must be a mapping"))
+                continue
+            entry_point = widget_config.get('entry_point')
+            if entry_point:
+                if plugin_index and entry_point not in installed_widgets:
+                    issues.append(('error', where, f"Widget entry point not installed: {entry_point}"))
+            else:
+                for field in ('path', 'class'):
+                    if not widget_config.get(field):
+                        issues.append(('error', where, f"Missing '{field}'"))
+            if widget_config.get('path') and not os.path.exists(widget_config['path']):
+                issues.append(('error', where, f"Widget module not found: {widget_config['path']}"))
+            priority = widget_config.get('priority', 100)
+            if isinstance(priority, bool) or not isinstance(priority, int):
+                issues.append(('error', where, "'priority' must be an integer"))
+            if not isinstance(widget_config.get('params') or {}, dict):
+                issues.append(('error', where, "'params' must be a mapping"))
+            else:
+                # Same rules as at runtime, where an invalid expansion skips the widget
+                try:
+                    expand_widget_config(widget_name, widget_config)
+                except ValueError as e:
+                    issues.append(('error', where, str(e)))
+            strategy = widget_config.get('strategy')
+            if strategy and strategy not in strategy_names and not (discover and strategy in installed_strategies):
+                issues.append(('warning', where,
+                               f"Strategy '{strategy}' is not registered, falling back to can_handle lookup"))
+    return issues
+
+
+def _init_worker(config_path: str, construct: bool, plugin_cache_path: str, slots, slot_counter) -> None:
+    """Prepare a worker process. Nothing from the configuration is imported here.
+
+    Args:
+        config_path (str): Path to the widget configuration file
+        construct (bool): Whether widgets will be constructed
+        plugin_cache_path (str): Entry point cache file of the parent's plugin index
+        slots: Shared array in which each worker publishes the task it is running
+        slot_counter: Shared counter handing out the slots
+    """
+    global _worker_config_path, _worker_plugin_index, _worker_app, _worker_slots, _worker_slot
+    if construct:
+        # Never open real windows, whatever platform the calling shell selects
+        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+        from PySide6 import QtWidgets
+        _worker_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    _worker_config_path = config_path
+    _worker_plugin_index = PluginIndex(plugin_cache_path)
+    with slot_counter.get_lock():
+        _worker_slot = slot_counter.value
+        slot_counter.value += 1
+    _worker_slots = slots
+
+
+def _get_worker_service() -> WidgetCreationService:
+    """Get the worker's service, loading the configured strategies on first use."""
+    global _worker_service
+    if _worker_service is None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _worker_service = WidgetCreationService(_worker_config_path, _worker_plugin_index)
+    return _worker_service
+
+
+def _run_task(task_id: int, check: Callable[..., List[Issue]], args: tuple) -> List[Issue]:
+    """Run a check, publishing its id so a crash can be traced back to it."""
+    _worker_slots[_worker_slot] = task_id
+    try:
+        return check(*args)
+    finally:
+        _worker_slots[_worker_slot] = -1
+
+
+def _check_strategy(strategy_path: str, class_name: str, where: str) -> List[Issue]:
+    """Import a strategy module and check the strategy class."""
+    try:
+        module = load_module_from_path(strategy_path, "dynamic_strategy")
+    except Exception as e:
+        return [('error', where, f"Failed to import {strategy_path}: {e}")]
+
+    strategy_class = getattr(module, class_name, None)
+    if strategy_class is None:
+        return [('error', where, f"Class {class_name} not found in {strategy_path}")]
+
+    missing_methods = [m for m in ('can_handle', 'create_widget') if not hasattr(strategy_class, m)]
+    if missing_methods:
+        return [('error', where, f"Strategy class {class_name} must implement methods: {', '.join(missing_methods)}")]
+    return []
+
+
+def _check_strategy_entry_point(entry_point: str, where: str) -> List[Issue]:
+    """Import a strategy registered by an installed package and check the strategy class."""
+    try:
+        strategy_class = _worker_plugin_index.load(STRATEGY_GROUP, entry_point)
+    except Exception as e:
+        return [('error', where, f"Failed to load strategy entry point {entry_point}: {e}")]
+
+    missing_methods = [m for m in ('can_handle', 'create_widget') if not hasattr(strategy_class, m)]
+    if missing_methods:
+        return [('error', where, f"Strategy class {entry_point} must implement methods: {', '.join(missing_methods)}")]
+    return []
+
+
+def _check_widget_module(module_path: str, entries: List[Tuple[str, str, Optional[str], List[Dict[str, Any]]]],
+                         construct: bool) -> List[Issue]:
+    """Import a widget module and check every configured class in it.
+
+    Args:
+        module_path (str): Path to the widget module
+        entries: (where, class_name, strategy_name, params_list) of each widget using the module
+        construct (bool): Also construct each widget offscreen
+
+    Returns:
+        List[Issue]: Problems found
+    """
+    try:
+        module = _get_worker_service()._load_module(module_path, "dynamic_widget")
+    except Exception as e:
+        return [('error', where, f"Failed to import {module_path}: {e}") for where, *_ in entries]
+
+    issues = []
+    for where, class_name, strategy_name, params_list in entries:
+        widget_class = getattr(module, class_name, None)
+        if widget_class is None:
+            issues.append(('error', where, f"Class {class_name} not found in {module_path}"))
+            continue
+        issues.extend(_check_widget_class(widget_class, class_name, where, strategy_name, params_list, construct))
+    return issues
+
+
+def _check_widget_entry_points(entries: List[Tuple[str, str, Optional[str], List[Dict[str, Any]]]],
+                               construct: bool) -> List[Issue]:
+    """Import widgets registered by installed packages and check them.
+
+    Args:
+        entries: (where, entry_point, strategy_name, params_list) of each widget
+        construct (bool): Also construct each widget offscreen
+
+    Returns:
+        List[Issue]: Problems found
+    """
+    issues = []
+    for where, entry_point, strategy_name, params_list in entries:
+        try:
+            widget_class = _get_worker_service().load_widget_entry_point(entry_point)
+        except Exception as e:
+            issues.append(('error', where, f"Failed to load widget entry point {entry_point}: {e}"))
+            continue
+        issues.extend(_check_widget_class(widget_class, entry_point, where, strategy_name, params_list, construct))
+    return issues
+
+
+def _check_widget_class(widget_class: type, class_name: str, where: str, strategy_name: Optional[str],
+                        params_list: List[Dict[str, Any]], construct: bool) -> List[Issue]:
+    """Check that a strategy handles a widget class and optionally construct it."""
+    issues = []
+    strategy = _get_worker_service().get_strategy(widget_class, strategy_name)
+    if strategy is None:
+        issues.append(('error', where, f"No suitable strategy found for widget class {class_name}"))
+        return issues
+    try:
+        handled = strategy.can_handle(widget_class)
+    except Exception:
+        handled = False
+    if not handled:
+        issues.append(('error', where, f"Strategy {type(strategy).__name__} cannot handle {class_name}"))
+        return issues
+
+    if construct:
+        for params in params_list:
+            try:
+                widget = strategy.create_widget(widget_class, params or {})
+            except Exception as e:
+                issues.append(('error', where, f"Failed to construct {class_name}: {e}"))
+                break
+            if widget is None:
+                issues.append(('error', where, f"Strategy returned no widget for {class_name}"))
+                break
+            widget.deleteLater()
+    return issues
+
+
+def check_config(config_path: str, construct: bool = False, jobs: Optional[int] = None,
+                 plugin_index: Optional[PluginIndex] = None) -> List[Issue]:
+    """Validate a configuration and import-check its modules in worker processes.
+
+    Widget modules are checked in parallel, one task per module file, so each
+    module is imported once no matter how many entries use it. Widgets from
+    installed entry points are checked together in one task.
+
+    Args:
+        config_path (str): Path to the widget configuration file
+        construct (bool): Also construct every widget on the offscreen platform
+        jobs (Optional[int]): Number of worker processes, defaults to the CPU count
+        plugin_index (Optional[PluginIndex]): Installed plugins, defaults to the process-wide index;
+            workers read the same cache file
+
+    Returns:
+        List[Issue]: (level, where, message) tuples, level is "error" or "warning"
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        widget_config = load_config(config_path)
+    if not widget_config:
+        return [('error', config_path, "Failed to load configuration")]
+
+    plugin_index = plugin_index or get_plugin_index()
+    issues = validate_config(widget_config, plugin_index)
+    if any(level == 'error' and where in _STRUCTURAL for level, where, message in issues):
+        return issues
+
+    widget_system = widget_config['widget_system']
+    tasks: List[Task] = []
+    for strategy_config in widget_system['strategies']:
+        if not isinstance(strategy_config, dict) or not strategy_config.get('enabled', True):
+            continue
+        where = f"strategies/{strategy_config.get('name')}"
+        entry_point = strategy_config.get('entry_point')
+        if entry_point:
+            if entry_point in plugin_index.get_entry_points(STRATEGY_GROUP):
+                tasks.append((_check_strategy_entry_point, (entry_point, where), [where]))
+            continue
+        path, class_name = strategy_config.get('path'), strategy_config.get('class')
+        if path and class_name and os.path.exists(path):
+            tasks.append((_check_strategy, (path, class_name, where), [where]))
+
+    installed_widgets = plugin_index.get_entry_points(WIDGET_GROUP)
+    modules: Dict[str, List] = {}
+    entry_point_widgets = []
+    for location, group_config in (widget_system.get('groups') or {}).items():
+        if not isinstance(group_config, dict) or not isinstance(group_config.get('widgets') or {}, dict):
+            continue
+        for widget_name, widget_config in (group_config.get('widgets') or {}).items():
+            if not isinstance(widget_config, dict):
+                continue
+            entry_point = widget_config.get('entry_point')
+            path, class_name = widget_config.get('path'), widget_config.get('class')
+            if entry_point:
+                if entry_point not in installed_widgets:
+                    continue
+            elif not path or not class_name or not os.path.exists(path):
+                continue
+            try:
+                params_list = [c.get('params') or {} for _, c in expand_widget_config(widget_name, widget_config)]
+            except Exception:
+                # Already reported by validate_config; the widget is skipped at runtime too
+                continue
+            where = f"{location}/{widget_name}"
+            if entry_point:
+                entry_point_widgets.append((where, entry_point, widget_config.get('strategy'), params_list))
+            else:
+                modules.setdefault(os.path.abspath(path), []).append(
+                    (where, class_name, widget_config.get('strategy'), params_list))
+
+    for path, entries in modules.items():
+        tasks.append((_check_widget_module, (path, entries, construct), [entry[0] for entry in entries]))
+    if entry_point_widgets:
+        tasks.append((_check_widget_entry_points, (entry_point_widgets, construct),
+                      [entry[0] for entry in entry_point_widgets]))
+
+    if tasks:
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+        issues.extend(_run_tasks(tasks, workers, (config_path, construct, plugin_index.cache_path)))
+    return issues
+
+
+def _run_tasks(tasks: List[Task], workers: int, initargs: tuple) -> List[Issue]:
+    """Run check tasks in worker processes, isolating tasks that crash their worker.
+
+    When a worker dies, the pool breaks and every unfinished task fails with
+    it. The tasks that had not started are run again in a new pool. The ones
+    that were running when the pool broke are run again one at a time, so
+    the crash is only reported against the task that causes it.
+
+    Args:
+        tasks (List[Task]): (check, args, wheres) of each task
+        workers (int): Number of worker processes
+        initargs (tuple): (config_path, construct, plugin_cache_path) for the workers
+
+    Returns:
+        List[Issue]: Problems found, in task order
+    """
+    results: Dict[int, List[Issue]] = {}
+    pending = list(range(len(tasks)))
+    suspects: List[int] = []
+    while pending or suspects:
+        if suspects:
+            batch, batch_workers = [suspects.pop(0)], 1
+        else:
+            batch, pending = pending, []
+            batch_workers = min(workers, len(batch))
+
+        done, running, broken = _run_pool(tasks, batch, batch_workers, initargs)
+        results.update(done)
+        if not broken:
+            continue
+
+        remaining = [task_id for task_id in batch if task_id not in done]
+        if len(batch) == 1:
+            results[batch[0]] = [('error', where, "Worker process crashed while checking this entry")
+                                 for where in tasks[batch[0]][2]]
+        elif not running and not done:
+            for task_id in remaining:
+                results[task_id] = [('error', where, "Worker process failed to start")
+                                    for where in tasks[task_id][2]]
+        else:
+            suspects.extend(task_id for task_id in remaining if task_id in running)
+            pending.extend(task_id for task_id in remaining if task_id not in running)
+
+    return [issue for task_id in sorted(results) for issue in results[task_id]]
+
+
+def _run_pool(tasks: List[Task], task_ids: List[int], workers: int,
+              initargs: tuple) -> Tuple[Dict[int, List[Issue]], Set[int], bool]:
+    """Run some tasks in a fresh process pool.
+
+    Returns:
+        Tuple: Results of the finished tasks, the tasks that were running if
+            the pool broke, and whether it broke
+    """
+    context = multiprocessing.get_context('spawn')
+    slots = context.Array('i', [-1] * workers)
+    slot_counter = context.Value('i', 0)
+    results: Dict[int, List[Issue]] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                initializer=_init_worker,
+                                                initargs=initargs + (slots, slot_counter)) as executor:
+        futures = {executor.submit(_run_task, task_id, tasks[task_id][0], tasks[task_id][1]): task_id
+                   for task_id in task_ids}
+        for future in concurrent.futures.as_completed(futures):
+            task_id = futures[future]
+            try:
+                results[task_id] = future.result()
+            except BrokenProcessPool:
+                return results, {task_id for task_id in slots[:] if task_id >= 0}, True
+            except Exception as e:
+                results[task_id] = [('error', where, f"Worker failed: {e!r}") for where in tasks[task_id][2]]
+    return results, set(), False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: ``python -m modular_qtwidgets check config.yaml``."""
+    parser = argparse.ArgumentParser(prog="python -m modular_qtwidgets")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    check_parser = subparsers.add_parser('check', help="Validate a widget configuration file")
+    check_parser.add_argument('config', nargs='+', help="Configuration files to check")
+    check_parser.add_argument('--construct', action='store_true',
+                              help="Also construct every widget on the offscreen platform")
+    check_parser.add_argument('-j', '--jobs', type=int, default=None,
+                              help="Number of worker processes (default: CPU count)")
+
+    args = parser.parse_args(argv)
+
+    error_count = 0
+    for config_path in args.config:
+        issues = check_config(config_path, construct=args.construct, jobs=args.jobs)
+        for level, where, message in sorted(issues, key=lambda i: (i[1], i[0])):
+            print(f"{config_path}: {level.upper()} {where}: {message}")
+        error_count += sum(1 for level, where, message in issues if level == 'error')
+
+    if error_count:
+        print(f"{error_count} error(s) found")
+        return 1
+    return 0
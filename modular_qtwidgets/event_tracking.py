@@ -0,0 +1,85 @@
+"""Event filter shared by the opt-in widget observers."""
+
+from typing import Any, Dict, Hashable, Optional
+
+from PySide6 import QtCore, QtWidgets
+
+
+class SubtreeEventFilter(QtCore.QObject):
+    """Watch the events of tracked widgets and, optionally, of their child widgets.
+
+    Each tracked widget is tagged with a key. Children that exist when a
+    widget is tracked and children polished later are tagged with the key of
+    their parent, so subclasses see the events of a whole widget subtree
+    under one key. Events are never consumed.
+    """
+
+    def __init__(self, include_children: bool = True, parent=None):
+        """Initialize the filter.
+
+        Args:
+            include_children (bool): Also track child widgets of tracked widgets
+            parent (QtCore.QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self.include_children = include_children
+        self._targets: Dict[QtCore.QObject, Any] = {}
+
+    def track(self, widget: QtWidgets.QWidget, key: Any) -> None:
+        """Start watching a widget and its children under a key.
+
+        Args:
+            widget (QtWidgets.QWidget): Widget to watch
+            key (Any): Value passed to ``tracked_event`` for events of the subtree
+        """
+        self._track(widget, key)
+        if self.include_children:
+            for child in widget.findChildren(QtWidgets.QWidget):
+                self._track(child, key)
+
+    def untrack(self, key: Optional[Hashable] = None) -> None:
+        """Stop watching the objects of a key, or all objects if no key is given."""
+        for obj, target_key in list(self._targets.items()):
+            if key is None or target_key == key:
+                obj.removeEventFilter(self)
+                del self._targets[obj]
+        if not self._targets:
+            self.tracking_stopped()
+
+    def tracked_event(self, obj: QtCore.QObject, key: Any, event: QtCore.QEvent) -> None:
+        """Handle an event of a tracked object. Override in subclasses.
+
+        Args:
+            obj (QtCore.QObject): Object receiving the event
+            key (Any): Key the object is tracked under
+            event (QtCore.QEvent): The event, which must not be consumed
+        """
+
+    def tracking_stopped(self) -> None:
+        """Called when the last tracked object was untracked or destroyed. Override in subclasses."""
+
+    def _forget(self, obj: QtCore.QObject) -> None:
+        """Drop a destroyed object."""
+        if self._targets.pop(obj, None) is not None and not self._targets:
+            self.tracking_stopped()
+
+    def _track(self, obj: QtCore.QObject, key: Any) -> None:
+        """Install the event filter on a single object."""
+        if obj in self._targets:
+            return
+        self._targets[obj] = key
+        obj.installEventFilter(self)
+        obj.destroyed.connect(lambda *args, o=obj: self._forget(o))
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Follow newly polished children and pass events of tracked objects on."""
+        key = self._targets.get(obj)
+        if key is None:
+            return False
+
+        if event.type() == QtCore.QEvent.ChildPolished and self.include_children:
+            child = event.child()
+            if child is not None and child.isWidgetType():
+                self._track(child, key)
+        self.tracked_event(obj, key, event)
+        return False
@@ -0,0 +1,238 @@
+"""Opt-in runtime cost instrumentation for created widgets."""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from PySide6 import QtCore, QtWidgets
+
+from .event_tracking import SubtreeEventFilter
+
+
+class WidgetStats:
+    """Event counters and paint timings of one configured widget."""
+
+    def __init__(self, location: str, widget_name: str):
+        """Initialize empty counters.
+
+        Args:
+            location (str): Location the widget was created for
+            widget_name (str): Name of the widget from config
+        """
+        self.location = location
+        self.widget_name = widget_name
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.events = 0
+        self.layout_requests = 0
+        self.resizes = 0
+        self.paints = 0
+        self.paint_time_ms = 0.0
+        self.max_paint_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary."""
+        return {
+            'location': self.location,
+            'widget_name': self.widget_name,
+            'events': self.events,
+            'layout_requests': self.layout_requests,
+            'resizes': self.resizes,
+            'paints': self.paints,
+            'paint_time_ms': self.paint_time_ms,
+            'max_paint_ms': self.max_paint_ms,
+        }
+
+
+class _PaintClock(QtCore.QObject):
+    """Time paint events without delivering them itself.
+
+    A paint is timed from the moment the tracked widget's filter sees it until
+    the next event is delivered anywhere in the application, which is seen
+    by an application-wide event filter. A posted event ends the last paint
+    of a frame when nothing else follows it.
+    """
+
+    _CLOSE_EVENT = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+    def __init__(self, parent=None):
+        """Initialize the clock without watching any events yet.
+
+        Args:
+            parent (QtCore.QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self._stats: Optional[WidgetStats] = None
+        self._start = 0.0
+        self._close_posted = False
+        self._installed = False
+
+    def install(self) -> None:
+        """Start watching application events."""
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and not self._installed:
+            app.installEventFilter(self)
+            self._installed = True
+
+    def uninstall(self) -> None:
+        """Stop watching application events, dropping a paint still being timed."""
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and self._installed:
+            try:
+                app.removeEventFilter(self)
+            except RuntimeError:
+                # The clock itself is already being destroyed, which removes the filter
+                pass
+        self._installed = False
+        self._stats = None
+
+    def start(self, stats: WidgetStats) -> None:
+        """Start timing a paint event of a widget."""
+        self.stop()
+        self._stats = stats
+        self._start = time.perf_counter()
+        if not self._close_posted:
+            self._close_posted = True
+            QtCore.QCoreApplication.postEvent(self, QtCore.QEvent(self._CLOSE_EVENT))
+
+    def stop(self) -> None:
+        """Add the time of the paint being timed to its widget."""
+        stats = self._stats
+        if stats is None:
+            return
+        self._stats = None
+        elapsed = (time.perf_counter() - self._start) * 1000.0
+        stats.paint_time_ms += elapsed
+        stats.max_paint_ms = max(stats.max_paint_ms, elapsed)
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        """End the paint being timed when the posted close event arrives."""
+        if event.type() == self._CLOSE_EVENT:
+            self._close_posted = False
+            self.stop()
+            return True
+        return super().event(event)
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """End the paint being timed when any other event is delivered."""
+        if self._stats is not None:
+            self.stop()
+        return False
+
+
+class WidgetInstrumentation(SubtreeEventFilter):
+    """Record layout requests, resizes, paints and paint time per configured widget.
+
+    Event filters are installed on each attached widget and on its child
+    widgets, including children polished later, so the cost of a whole
+    widget subtree is reported under the name it has in the config. Events
+    are never consumed, so attached widgets behave and render as before.
+
+    While any widget is attached, an application-wide event filter written
+    in Python sees every event of the process, which slows down the whole
+    application, including the paints being measured. A paint is timed until
+    the next event anywhere in the application, so the last widget painted
+    in a frame is also charged with flushing the window. Use the numbers to
+    compare widgets, not as exact paint durations. The application filter is
+    removed once the last attached widget is detached or destroyed.
+    """
+
+    def __init__(self, include_children: bool = True, parent=None):
+        """Initialize the instrumentation.
+
+        Args:
+            include_children (bool): Also track child widgets of attached widgets
+            parent (QtCore.QObject, optional): Parent object.
+        """
+        super().__init__(include_children, parent)
+        self._stats: Dict[str, WidgetStats] = {}
+        self._paint_clock = _PaintClock(self)
+
+    def attach(self, widget: QtWidgets.QWidget, location: str, widget_name: str) -> WidgetStats:
+        """Start recording events of a widget.
+
+        Args:
+            widget (QtWidgets.QWidget): Widget to track
+            location (str): Location the widget was created for
+            widget_name (str): Name of the widget from config
+
+        Returns:
+            WidgetStats: Live counters of the widget
+        """
+        key = f"{location}/{widget_name}"
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = WidgetStats(location, widget_name)
+            self._stats[key] = stats
+
+        self._paint_clock.install()
+        self.track(widget, stats)
+        return stats
+
+    def on_widget_created(self, location: str):
+        """Return a widget creation callback that attaches each created widget.
+
+        Args:
+            location (str): Location the widgets are created for
+
+        Returns:
+            Callable[[QtWidgets.QWidget, str, Dict], None]: Callback for create_widgets_for_location
+        """
+        def callback(widget: QtWidgets.QWidget, widget_name: str, widget_config: Dict):
+            self.attach(widget, location, widget_name)
+        return callback
+
+    def detach_all(self) -> None:
+        """Stop recording events. Collected stats are kept."""
+        self.untrack()
+
+    def reset(self) -> None:
+        """Reset all counters to zero while keeping widgets attached."""
+        for stats in self._stats.values():
+            stats.reset()
+
+    def get_stats(self, location: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the current counters, most expensive painters first.
+
+        Args:
+            location (Optional[str]): Only return widgets of this location
+
+        Returns:
+            List[Dict[str, Any]]: Counters of each widget
+        """
+        stats = [s.to_dict() for s in self._stats.values()
+                 if location is None or s.location == location]
+        return sorted(stats, key=lambda s: s['paint_time_ms'], reverse=True)
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Dump the current counters as JSON.
+
+        Args:
+            path (Optional[str]): File to write the JSON to
+
+        Returns:
+            str: JSON text of the counters
+        """
+        text = json.dumps(self.get_stats(), indent=2)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        return text
+
+    def tracking_stopped(self) -> None:
+        """Stop watching application events once no widget is attached."""
+        self._paint_clock.uninstall()
+
+    def tracked_event(self, obj: QtCore.QObject, stats: WidgetStats, event: QtCore.QEvent) -> None:
+        """Count events of tracked objects and time their paint events."""
+        stats.events += 1
+        event_type = event.type()
+        if event_type == QtCore.QEvent.Paint:
+            stats.paints += 1
+            self._paint_clock.start(stats)
+        elif event_type == QtCore.QEvent.LayoutRequest:
+            stats.layout_requests += 1
+        elif event_type == QtCore.QEvent.Resize:
+            stats.resizes += 1
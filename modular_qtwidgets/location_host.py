@@ -0,0 +1,207 @@
+"""Location host widgets that build their widgets on demand."""
+
+import time
+import bisect
+import logging
+import itertools
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from PySide6 import QtCore, QtWidgets
+
+from .widget_loader import WidgetCreationService, widget_batch_key
+from .service_registry import get_shared_service
+from .instrumentation import WidgetInstrumentation
+from .usage_profile import UsageProfile
+
+
+class LocationHostWidget(QtWidgets.QWidget):
+    """Widget that creates the widgets of one location the first time it is shown."""
+
+    def __init__(self, config_path: str, location: str, parent=None,
+                 instrumentation: Optional[WidgetInstrumentation] = None,
+                 usage_profile: Optional[UsageProfile] = None):
+        """Initialize the host widget.
+
+        Args:
+            config_path (str): Path to the widget configuration file
+            location (str): Location name to build
+            parent (QtWidgets.QWidget, optional): Parent widget.
+            instrumentation (Optional[WidgetInstrumentation]): Records runtime costs of created widgets
+            usage_profile (Optional[UsageProfile]): Builds the most used widgets first and defers the rest
+        """
+        super().__init__(parent)
+        self.config_path = config_path
+        self.location = location
+        self.instrumentation = instrumentation
+        self.usage_profile = usage_profile
+        self.item_widgets: List[QtWidgets.QWidget] = []
+        self._service: Optional[WidgetCreationService] = None
+        self._built = False
+        self._slots: Dict[str, int] = {}
+        self._placed_slots: List[int] = []
+        self._deferred: List[List[Tuple[str, Dict]]] = []
+        self._deferred_timer = QtCore.QTimer(self)
+        self._deferred_timer.setSingleShot(True)
+        self._deferred_timer.setInterval(0)
+        self._deferred_timer.timeout.connect(self._build_deferred)
+        self.setup_ui()
+
+    def setup_ui(self) -> None:
+        """Set up the widget's UI."""
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+        self.setLayout(self.main_layout)
+
+        self.scroll_area = QtWidgets.QScrollArea(self)
+        self.scroll_area.setWidgetResizable(True)
+        self.main_layout.addWidget(self.scroll_area)
+
+        self.container = QtWidgets.QWidget()
+        self.scroll_area.setWidget(self.container)
+        self.container_layout = QtWidgets.QVBoxLayout(self.container)
+        self.container_layout.addStretch()
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the widgets of this location have been created."""
+        return self._built
+
+    def get_service(self) -> WidgetCreationService:
+        """Get the shared creation service for this host, loading the configuration on first use."""
+        if self._service is None:
+            self._service = get_shared_service(self.config_path)
+        return self._service
+
+    def iter_prefetch(self) -> Iterator[str]:
+        """Load configuration, strategies and widget modules one step at a time.
+
+        Nothing is done once the host has been built.
+
+        Yields:
+            str: Path of the configuration or widget module loaded in each step
+        """
+        if self._built:
+            return
+        self.get_service()
+        yield self.config_path
+
+        for module_path in self.get_service().iter_prefetch_location(self.location):
+            yield module_path
+            if self._built:
+                return
+
+    def build(self) -> None:
+        """Create the widgets of this location if that has not happened yet."""
+        if self._built:
+            return
+        self._built = True
+
+        try:
+            service = self.get_service()
+            instances = service.get_widget_instances(self.location)
+            self._slots = {widget_name: index for index, (widget_name, widget_config) in enumerate(instances)}
+
+            # With usage data, build the most used widgets now and the rest from the event loop
+            deferred = []
+            if self.usage_profile is not None:
+                eager, deferred = self.usage_profile.split(self.location, instances)
+                if eager:
+                    instances = eager
+                else:
+                    deferred = []
+
+            widgets = service.create_widget_instances(instances, self.add_widget)
+            if deferred:
+                self._deferred = [list(run) for key, run in itertools.groupby(deferred, key=widget_batch_key)]
+                self._deferred_timer.start()
+
+            if not widgets and not deferred:
+                logging.warning(f"No widgets loaded for location {self.location}")
+                error_label = QtWidgets.QLabel("No widgets loaded from configuration")
+                self.container_layout.insertWidget(self.container_layout.count() - 1, error_label)
+
+        except Exception as e:
+            logging.error(f"Error loading widgets for location {self.location}: {e}")
+            error_label = QtWidgets.QLabel(f"Error loading widgets: {str(e)}")
+            self.container_layout.insertWidget(self.container_layout.count() - 1, error_label)
+
+    def has_deferred(self) -> bool:
+        """Whether some widgets of this location are still waiting to be created."""
+        return bool(self._deferred)
+
+    def _build_deferred(self) -> None:
+        """Create the next run of deferred widgets and schedule the one after it."""
+        if not self._deferred:
+            return
+        self.get_service().create_widget_instances(self._deferred.pop(0), self.add_widget)
+        if self._deferred:
+            self._deferred_timer.start()
+
+    def add_widget(self, widget: QtWidgets.QWidget, widget_name: str, widget_config: Dict) -> None:
+        """Add a created widget to the host in its configured position. Override to customize placement."""
+        slot = self._slots.get(widget_name, len(self._slots))
+        index = bisect.bisect(self._placed_slots, slot)
+        self._placed_slots.insert(index, slot)
+        self.item_widgets.insert(index, widget)
+        self.container_layout.insertWidget(index, widget)
+        if self.instrumentation is not None:
+            self.instrumentation.attach(widget, self.location, widget_name)
+        if self.usage_profile is not None:
+            self.usage_profile.attach(widget, self.location, widget_name)
+
+    def showEvent(self, event) -> None:
+        """Build the location the first time the host is shown."""
+        self.build()
+        super().showEvent(event)
+
+
+class IdlePrefetcher(QtCore.QObject):
+    """Prefetch location hosts that have not been shown yet while the event loop is idle.
+
+    Work runs from a zero-interval timer, which Qt fires when no other events are
+    pending. Each slice stops once ``budget_ms`` has elapsed.
+    """
+
+    finished = QtCore.Signal()
+
+    def __init__(self, budget_ms: float = 10.0, parent=None):
+        """Initialize the prefetcher.
+
+        Args:
+            budget_ms (float): Time budget per idle slice in milliseconds
+            parent (QtCore.QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self._pending: List[Iterator[str]] = []
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    def add_host(self, host: LocationHostWidget) -> None:
+        """Queue a host for prefetching."""
+        self._pending.append(host.iter_prefetch())
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def has_pending(self) -> bool:
+        """Whether there is prefetch work left."""
+        return bool(self._pending)
+
+    def _run_slice(self) -> None:
+        """Run prefetch steps until the time budget of this slice is used up."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while self._pending:
+            try:
+                next(self._pending[0])
+            except StopIteration:
+                self._pending.pop(0)
+            except Exception as e:
+                logging.warning(f"Prefetch failed: {e}")
+                self._pending.pop(0)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self._pending:
+            self._timer.stop()
+            self.finished.emit()
@@ -0,0 +1,188 @@
+"""Discovery of strategies and widgets from installed packages."""
+
+import os
+import sys
+import json
+import site
+import hashlib
+import logging
+import importlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+STRATEGY_GROUP = "modular_qtwidgets.strategies"
+WIDGET_GROUP = "modular_qtwidgets.widgets"
+GROUPS = (STRATEGY_GROUP, WIDGET_GROUP)
+
+
+def default_cache_path() -> str:
+    """Get the file the entry point index is stored in."""
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "modular_qtwidgets", "entry_points.json")
+
+
+def site_directories() -> List[str]:
+    """Get the site-packages directories packages are installed into by default."""
+    directories = list(getattr(site, 'getsitepackages', lambda: [])())
+    if site.ENABLE_USER_SITE:
+        directories.append(site.getusersitepackages())
+    return directories
+
+
+def environment_fingerprint(directories: Iterable[str] = ()) -> str:
+    """Fingerprint the installed distributions without reading their metadata.
+
+    Installing or removing a distribution adds or removes its metadata
+    directory, which changes the mtime of the directory that holds it. Only
+    the site directories and the given directories, which held distribution
+    metadata at the last scan, are checked, so edits to script or source
+    directories on ``sys.path`` do not count. Changes to ``sys.path`` itself do.
+
+    Args:
+        directories (Iterable[str]): Directories known to hold distribution metadata
+    """
+    parts = [sys.version] + [path for path in sys.path if path]
+    for path in sorted(set(site_directories()) | set(directories)):
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}:-")
+    return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+
+
+def _scan_entry_points() -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+    """Read the entry points of all installed distributions.
+
+    Returns:
+        Tuple[Dict, List[str]]: Entry point values by group and name, and the
+            directories the distribution metadata was found in
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata
+
+    directories = set()
+    for dist in metadata.distributions():
+        try:
+            directories.add(os.path.abspath(str(dist.locate_file(''))))
+        except Exception:
+            continue
+
+    entry_points = metadata.entry_points()
+    groups = {}
+    for group in GROUPS:
+        if hasattr(entry_points, 'select'):
+            selected = entry_points.select(group=group)
+        else:
+            selected = entry_points.get(group, [])
+        groups[group] = {ep.name: ep.value for ep in selected}
+    return groups, sorted(directories)
+
+
+def load_object(value: str) -> Any:
+    """Import the object an entry point value such as ``package.module:Class`` refers to."""
+    module_name, _, attribute = value.partition(':')
+    obj = importlib.import_module(module_name.strip())
+    for name in attribute.strip().split('.') if attribute.strip() else []:
+        obj = getattr(obj, name)
+    return obj
+
+
+class PluginIndex:
+    """Entry points of the plugin groups, cached on disk per environment.
+
+    The cache is reused while the environment fingerprint is unchanged, so
+    distribution metadata is only read after packages were installed or
+    removed. Entry points are stored as strings; nothing is imported until
+    ``load`` is called.
+    """
+
+    VERSION = 2
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize the index. Entry points are read on first use.
+
+        Args:
+            cache_path (Optional[str]): File to cache the entry points in
+        """
+        self.cache_path = cache_path or default_cache_path()
+        self._lock = threading.Lock()
+        self._groups: Optional[Dict[str, Dict[str, str]]] = None
+        self._loaded: Dict[str, Any] = {}
+
+    def get_entry_points(self, group: str) -> Dict[str, str]:
+        """Get the entry points of a group.
+
+        Args:
+            group (str): Entry point group, e.g. ``STRATEGY_GROUP``
+
+        Returns:
+            Dict[str, str]: Entry point values by name
+        """
+        with self._lock:
+            if self._groups is None:
+                self._groups = self._read()
+            return dict(self._groups.get(group, {}))
+
+    def load(self, group: str, name: str) -> Any:
+        """Import the object of an entry point.
+
+        Args:
+            group (str): Entry point group
+            name (str): Entry point name
+
+        Returns:
+            Any: The loaded object
+        """
+        key = f"{group}:{name}"
+        if key not in self._loaded:
+            value = self.get_entry_points(group).get(name)
+            if value is None:
+                raise LookupError(f"No entry point named {name} in group {group}")
+            self._loaded[key] = load_object(value)
+        return self._loaded[key]
+
+    def invalidate(self) -> None:
+        """Forget the entry points so they are read again on next use."""
+        with self._lock:
+            self._groups = None
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        """Get the entry points from the cache, rescanning if the environment changed."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') == self.VERSION and
+                    data.get('fingerprint') == environment_fingerprint(data.get('directories', []))):
+                return data.get('groups', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Failed to load entry point cache {self.cache_path}: {e}")
+
+        groups, directories = _scan_entry_points()
+        fingerprint = environment_fingerprint(directories)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'fingerprint': fingerprint,
+                           'directories': directories, 'groups': groups}, f, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            logging.warning(f"Failed to save entry point cache {self.cache_path}: {e}")
+        return groups
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_plugin_index() -> PluginIndex:
+    """Get the process-wide plugin index."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = PluginIndex()
+        return _default_index
@@ -0,0 +1,87 @@
+"""Process-wide registry of shared widget creation services."""
+
+import os
+import hashlib
+import threading
+from typing import Dict, Optional, Tuple
+
+from .widget_loader import WidgetCreationService
+
+
+class ServiceRegistry:
+    """Share one WidgetCreationService per configuration file and content.
+
+    Services are keyed by the absolute config path and a hash of the file
+    content, so a changed file gets a fresh service while unchanged files
+    reuse the already parsed config, loaded strategies and cached modules.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.RLock()
+        self._services: Dict[str, Tuple[str, WidgetCreationService]] = {}
+        self._stats: Dict[str, Tuple[int, int, str]] = {}
+
+    def get_service(self, config_path: str) -> WidgetCreationService:
+        """Get the shared service for a configuration file.
+
+        Args:
+            config_path (str): Path to the widget configuration file
+
+        Returns:
+            WidgetCreationService: Service for the current content of the file
+        """
+        key = os.path.abspath(config_path)
+        with self._lock:
+            content_hash = self._content_hash(key)
+            entry = self._services.get(key)
+            if entry and entry[0] == content_hash:
+                return entry[1]
+
+            service = WidgetCreationService(config_path)
+            self._services[key] = (content_hash, service)
+            return service
+
+    def invalidate(self, config_path: Optional[str] = None) -> None:
+        """Drop the shared service of a configuration file, or all of them.
+
+        Args:
+            config_path (Optional[str]): Path to drop, or None to clear the registry
+        """
+        with self._lock:
+            if config_path is None:
+                self._services.clear()
+                self._stats.clear()
+                return
+            key = os.path.abspath(config_path)
+            self._services.pop(key, None)
+            self._stats.pop(key, None)
+
+    def _content_hash(self, key: str) -> str:
+        """Hash the file content, skipping the read when size and mtime are unchanged."""
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return ""
+
+        cached = self._stats.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with open(key, 'rb') as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+        self._stats[key] = (stat.st_mtime_ns, stat.st_size, content_hash)
+        return content_hash
+
+
+_default_registry = ServiceRegistry()
+
+
+def get_shared_service(config_path: str) -> WidgetCreationService:
+    """Get the process-wide shared service for a configuration file."""
+    return _default_registry.get_service(config_path)
+
+
+def invalidate_shared_services(config_path: Optional[str] = None) -> None:
+    """Drop process-wide shared services for a configuration file, or all of them."""
+    _default_registry.invalidate(config_path)
@@ -0,0 +1,164 @@
+"""Local usage profiles that guide widget construction order across launches."""
+
+import os
+import json
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from PySide6 import QtCore, QtWidgets
+
+from .event_tracking import SubtreeEventFilter
+
+_INTERACTION_EVENTS = (
+    QtCore.QEvent.MouseButtonPress,
+    QtCore.QEvent.KeyPress,
+    QtCore.QEvent.Wheel,
+    QtCore.QEvent.TouchBegin,
+)
+
+
+class UsageProfile(SubtreeEventFilter):
+    """Record when widgets are first shown and first used, and rank them on the next launch.
+
+    Each widget has a score that decays every session. It grows by one in
+    sessions where the widget was interacted with, and by ``visible_weight``
+    in sessions where it was only shown. Widgets scoring at least
+    ``threshold`` are built first, highest score first and, on equal scores,
+    the one used or shown earliest in the last session first; the rest can be
+    deferred. The profile is a JSON file and is only written by ``save``.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, decay: float = 0.8, threshold: float = 0.5,
+                 visible_weight: float = 0.25, parent=None):
+        """Load the profile from disk if it exists.
+
+        Args:
+            path (str): JSON file to read and write the profile
+            decay (float): Factor applied to every score once per saved session
+            threshold (float): Minimum score for a widget to be built first
+            visible_weight (float): Score added in sessions where a widget was shown but not used
+            parent (QtCore.QObject, optional): Parent object.
+        """
+        super().__init__(True, parent)
+        self.path = path
+        self.decay = decay
+        self.threshold = threshold
+        self.visible_weight = visible_weight
+        self._session_start = time.perf_counter()
+        self._locations: Dict[str, Dict[str, Dict]] = self._load()
+        self._session: Dict[Tuple[str, str], Dict[str, Optional[float]]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        """Read the profile file, ignoring missing or unreadable files."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                return data.get('locations', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Failed to load usage profile {self.path}: {e}")
+        return {}
+
+    def get_score(self, location: str, widget_name: str) -> float:
+        """Get the usage score of a widget from previous sessions."""
+        return self._locations.get(location, {}).get(widget_name, {}).get('score', 0.0)
+
+    def _sort_key(self, location: str, widget_name: str) -> Tuple[float, float, float]:
+        """Order widgets by score, then by how early they were used and shown last time."""
+        entry = self._locations.get(location, {}).get(widget_name, {})
+        return (-entry.get('score', 0.0),
+                entry.get('first_interaction_ms', float('inf')),
+                entry.get('first_visible_ms', float('inf')))
+
+    def split(self, location: str, instances: List[Tuple[str, Dict]]) -> Tuple[List[Tuple[str, Dict]], List[Tuple[str, Dict]]]:
+        """Split widget instances into those to build first and those to defer.
+
+        Args:
+            location (str): Location the instances belong to
+            instances (List[Tuple[str, Dict]]): Name and configuration of each instance, in priority order
+
+        Returns:
+            Tuple[List, List]: Instances to build first, most used first, and the
+                remaining instances in their original order
+        """
+        eager = [i for i in instances if self.get_score(location, i[0]) >= self.threshold]
+        eager.sort(key=lambda i: self._sort_key(location, i[0]))
+        eager_names = {name for name, config in eager}
+        deferred = [i for i in instances if i[0] not in eager_names]
+        return eager, deferred
+
+    def attach(self, widget: QtWidgets.QWidget, location: str, widget_name: str) -> None:
+        """Start recording first visibility and first interaction of a widget.
+
+        Args:
+            widget (QtWidgets.QWidget): Widget to track, including its child widgets
+            location (str): Location the widget was created for
+            widget_name (str): Name of the widget from config
+        """
+        key = (location, widget_name)
+        self._session.setdefault(key, {'first_visible_ms': None, 'first_interaction_ms': None})
+        self.track(widget, key)
+        if widget.isVisible():
+            self._record(key, 'first_visible_ms')
+
+    def save(self) -> None:
+        """Fold this session into the scores and write the profile to disk.
+
+        Every stored score decays, including those of widgets that were not
+        built or attached this session, so widgets that stop being used fall
+        below the threshold over time.
+        """
+        for widgets in self._locations.values():
+            for entry in widgets.values():
+                entry['score'] = entry.get('score', 0.0) * self.decay
+
+        for (location, widget_name), session in self._session.items():
+            entry = self._locations.setdefault(location, {}).setdefault(widget_name, {'score': 0.0, 'sessions': 0})
+            if session['first_interaction_ms'] is not None:
+                gain = 1.0
+            elif session['first_visible_ms'] is not None:
+                gain = self.visible_weight
+            else:
+                gain = 0.0
+            entry['score'] = entry.get('score', 0.0) + gain
+            entry['sessions'] = entry.get('sessions', 0) + 1
+            # Only this session's times are kept, so the tie-break in split follows recent use
+            for field in ('first_visible_ms', 'first_interaction_ms'):
+                if session[field] is not None:
+                    entry[field] = session[field]
+                else:
+                    entry.pop(field, None)
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'locations': self._locations}, f, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logging.warning(f"Failed to save usage profile {self.path}: {e}")
+
+        self._session.clear()
+
+    def _record(self, key: Tuple[str, str], field: str) -> None:
+        """Record the first occurrence of an event and stop tracking once nothing is left to record."""
+        session = self._session[key]
+        if session[field] is None:
+            session[field] = (time.perf_counter() - self._session_start) * 1000.0
+
+        if all(value is not None for value in session.values()):
+            self.untrack(key)
+
+    def tracked_event(self, obj: QtCore.QObject, key: Tuple[str, str], event: QtCore.QEvent) -> None:
+        """Record first show and first interaction of tracked widgets."""
+        event_type = event.type()
+        if event_type in _INTERACTION_EVENTS:
+            self._record(key, 'first_interaction_ms')
+        elif event_type == QtCore.QEvent.Show:
+            self._record(key, 'first_visible_ms')
@@ -3,27 +3,46 @@
 import os
 import sys
 import logging
+import itertools
 import importlib.util
-from typing import Any, Dict, Optional, List, Tuple, Callable, Type
+from typing import Any, Dict, Optional, List, Tuple, Callable, Type, Iterator
 
 import yaml
 from PySide6 import QtWidgets
 
+from .plugins import PluginIndex, STRATEGY_GROUP, WIDGET_GROUP, get_plugin_index
+
 
 class WidgetCreationService:
     """Service for creating widgets using different strategies."""
     
-    def __init__(self, config_path: str):
-        """Initialize the service with empty strategies dictionary."""
+    def __init__(self, config_path: str, plugin_index: Optional[PluginIndex] = None):
+        """Initialize the service with empty strategies dictionary.
+
+        Args:
+            config_path (str): Path to the widget configuration file
+            plugin_index (Optional[PluginIndex]): Index of installed plugins, defaults to the process-wide one
+        """
         self.widget_config = load_config(config_path)
+        self.plugin_index = plugin_index
         self._strategies = {}
+        self._lazy_strategies = {}
+        self._failed_strategies = set()
+        self._modules = {}
         self._register_default_strategies()
         
     def _register_default_strategies(self):
-        """Register default widget creation strategies."""
+        """Register default widget creation strategies.
+
+        Strategies given by ``entry_point`` are only imported when first needed.
+        """
         for strategy_config in self.widget_config['widget_system']['strategies']:
             if not strategy_config.get('enabled', True):
                 continue
+
+            if strategy_config.get('entry_point'):
+                self._lazy_strategies[strategy_config['name']] = strategy_config['entry_point']
+                continue
                 
             strategy_path = strategy_config.get('path')
             class_name = strategy_config.get('class')
@@ -38,19 +57,75 @@ class WidgetCreationService:
     def register_strategy(self, name: str, strategy):
         """Register a new widget creation strategy."""
         self._strategies[name] = strategy
+
+    def get_plugin_index(self) -> PluginIndex:
+        """Get the index of installed strategy and widget plugins."""
+        if self.plugin_index is None:
+            self.plugin_index = get_plugin_index()
+        return self.plugin_index
+
+    def _discover_plugins(self) -> bool:
+        """Whether strategies from installed packages may be used without being configured."""
+        system_config = self.widget_config.get('widget_system', {}).get('config') or {}
+        return system_config.get('discover_plugins', True)
+
+    def _pending_strategy_names(self) -> List[str]:
+        """Names of strategies that are known but not imported yet, configured ones first."""
+        names = [name for name in self._lazy_strategies if name not in self._strategies]
+        if self._discover_plugins():
+            names += [name for name in self.get_plugin_index().get_entry_points(STRATEGY_GROUP)
+                      if name not in self._strategies and name not in names]
+        return [name for name in names if name not in self._failed_strategies]
+
+    def _load_lazy_strategy(self, name: str):
+        """Import, instantiate and register a strategy from an entry point.
+
+        Args:
+            name (str): Strategy name from the config, or an installed entry point name
+
+        Returns:
+            The registered strategy, or None if it is unknown or failed to load
+        """
+        if name in self._failed_strategies:
+            return None
+
+        entry_point = self._lazy_strategies.get(name)
+        if entry_point is None:
+            if not self._discover_plugins() or name not in self.get_plugin_index().get_entry_points(STRATEGY_GROUP):
+                return None
+            entry_point = name
+
+        try:
+            strategy_class = self.get_plugin_index().load(STRATEGY_GROUP, entry_point)
+            required_methods = ['can_handle', 'create_widget']
+            missing_methods = [method for method in required_methods if not hasattr(strategy_class, method)]
+            if missing_methods:
+                raise TypeError(f"Strategy class {entry_point} must implement methods: {', '.join(missing_methods)}")
+            strategy = strategy_class()
+        except Exception as e:
+            logging.error(f"Failed to load strategy entry point {entry_point}: {e}")
+            self._failed_strategies.add(name)
+            return None
+
+        self.register_strategy(name, strategy)
+        return strategy
         
+    def _load_module(self, module_path: str, module_name: str):
+        """Load a module from a file path, reusing it if it was loaded before."""
+        key = os.path.abspath(module_path)
+        module = self._modules.get(key)
+        if module is None:
+            module = load_module_from_path(module_path, module_name)
+            self._modules[key] = module
+        return module
+
     def load_strategy_class(self, strategy_path: str, class_name: str) -> Optional[type]:
         """Load a strategy class from a module."""
         try:
             if not os.path.exists(strategy_path):
                 raise FileNotFoundError(f"Could not find strategy module {strategy_path}")
                 
-            spec = importlib.util.spec_from_file_location("dynamic_strategy", strategy_path)
-            if not spec or not spec.loader:
-                raise ImportError(f"Failed to load spec for {strategy_path}")
-                
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = self._load_module(strategy_path, "dynamic_strategy")
             strategy_class = getattr(module, class_name)
             required_methods = ['can_handle', 'create_widget']
             missing_methods = [method for method in required_methods if not hasattr(strategy_class, method)]
@@ -62,6 +137,61 @@ class WidgetCreationService:
             print(f"Failed to load strategy class: {e}")
             return None
     
+    def load_widget_class(self, module_path: str, class_name: str) -> type:
+        """Load a widget class from a module.
+
+        Modules are cached per service, so loading the same path again is cheap.
+
+        Args:
+            module_path (str): Path to the widget module
+            class_name (str): Name of the widget class in the module
+
+        Returns:
+            type: The widget class
+        """
+        module = self._load_module(module_path, "dynamic_widget")
+        return getattr(module, class_name)
+
+    def load_widget_entry_point(self, entry_point: str) -> type:
+        """Load a widget class registered by an installed package.
+
+        Args:
+            entry_point (str): Entry point name in the ``modular_qtwidgets.widgets`` group
+
+        Returns:
+            type: The widget class
+        """
+        return self.get_plugin_index().load(WIDGET_GROUP, entry_point)
+
+    def get_strategy(self, widget_class: type, strategy_name: str = None):
+        """Get the strategy for a widget class.
+
+        Args:
+            widget_class (type): Widget class to create
+            strategy_name (str, optional): Name of the preferred strategy
+
+        Returns:
+            The named strategy if registered, else the first one that can handle the class, or None
+        """
+        if strategy_name:
+            if strategy_name in self._strategies:
+                return self._strategies[strategy_name]
+            strategy = self._load_lazy_strategy(strategy_name)
+            if strategy:
+                return strategy
+
+        # Find first strategy that can handle this widget class
+        for s in self._strategies.values():
+            if s.can_handle(widget_class):
+                return s
+
+        # Strategies from entry points are only imported when no loaded one can handle the class
+        for name in self._pending_strategy_names():
+            strategy = self._load_lazy_strategy(name)
+            if strategy and strategy.can_handle(widget_class):
+                return strategy
+        return None
+
     def create_widget(self, module_path: str, class_name: str, params: Dict[str, Any] = None,
                      strategy_name: str = None) -> Optional[QtWidgets.QWidget]:
         """Create a widget using registered strategies."""
@@ -69,29 +199,8 @@ class WidgetCreationService:
             params = {}
             
         try:
-            if not os.path.exists(module_path):
-                raise FileNotFoundError(f"Could not find module {module_path}")
-            
-            spec = importlib.util.spec_from_file_location("dynamic_widget", module_path)
-            if not spec or not spec.loader:
-                raise ImportError(f"Failed to load spec for {module_path}")
-                
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            widget_class = getattr(module, class_name)
-            
-            # Get strategy
-            strategy = None
-            if strategy_name and strategy_name in self._strategies:
-                strategy = self._strategies[strategy_name]
-            else:
-                # Find first strategy that can handle this widget class
-                for s in self._strategies.values():
-                    if s.can_handle(widget_class):
-                        strategy = s
-                        break
-                        
+            widget_class = self.load_widget_class(module_path, class_name)
+            strategy = self.get_strategy(widget_class, strategy_name)
             if strategy:
                 return strategy.create_widget(widget_class, params)
                 
@@ -100,6 +209,59 @@ class WidgetCreationService:
         except Exception as e:
             logging.error(f"Failed to create widget: {e}")
             return None
+
+    def create_widgets(self, module_path: str, class_name: str, params_list: List[Dict[str, Any]],
+                       strategy_name: str = None, entry_point: str = None) -> List[Optional[QtWidgets.QWidget]]:
+        """Create several widgets of the same class with one strategy lookup.
+
+        Strategies that implement ``create_widgets`` get the whole batch at once;
+        otherwise ``create_widget`` is called for each entry. If the batch call
+        fails, the widgets are created one at a time so one bad entry does not
+        drop the others.
+
+        Args:
+            module_path (str): Path to the widget module
+            class_name (str): Name of the widget class in the module
+            params_list (List[Dict[str, Any]]): Constructor parameters of each widget
+            strategy_name (str, optional): Name of the strategy to use
+            entry_point (str, optional): Installed widget entry point to use instead of module_path and class_name
+
+        Returns:
+            List[Optional[QtWidgets.QWidget]]: One entry per params, None where creation failed
+        """
+        params_list = [params or {} for params in params_list]
+
+        try:
+            if entry_point:
+                widget_class = self.load_widget_entry_point(entry_point)
+                class_name = entry_point
+            else:
+                widget_class = self.load_widget_class(module_path, class_name)
+            strategy = self.get_strategy(widget_class, strategy_name)
+            if not strategy:
+                raise ValueError(f"No suitable strategy found for widget class {widget_class.__name__}")
+        except Exception as e:
+            logging.error(f"Failed to create widgets: {e}")
+            return [None] * len(params_list)
+
+        create_batch = getattr(strategy, 'create_widgets', None)
+        if create_batch:
+            try:
+                widgets = list(create_batch(widget_class, params_list))
+                if len(widgets) == len(params_list):
+                    return widgets
+                raise ValueError(f"Strategy returned {len(widgets)} widgets for {len(params_list)} params")
+            except Exception as e:
+                logging.error(f"Batch creation of {class_name} failed, creating widgets one by one: {e}")
+
+        widgets = []
+        for params in params_list:
+            try:
+                widgets.append(strategy.create_widget(widget_class, params))
+            except Exception as e:
+                logging.error(f"Failed to create widget: {e}")
+                widgets.append(None)
+        return widgets
     
     def get_widgets_for_location(self, location: str) -> List[Tuple[int, str, Dict]]:
         """Get all widget configurations for a specific location."""
@@ -133,6 +295,34 @@ class WidgetCreationService:
             
         return sorted(widgets, key=lambda x: x[0])
         
+    def iter_prefetch_location(self, location: str) -> Iterator[str]:
+        """Load the widget modules of a location one at a time without creating widgets.
+
+        This lets callers spread the import cost over several event loop iterations.
+
+        Args:
+            location (str): Location name to prefetch
+
+        Yields:
+            str: Path of each widget module after it has been loaded
+        """
+        for priority, widget_name, widget_config in self.get_widgets_for_location(location):
+            widget_path = widget_config.get('path', '')
+            widget_class = widget_config.get('class', '')
+            entry_point = widget_config.get('entry_point')
+
+            if not entry_point and (not widget_path or not widget_class):
+                continue
+
+            try:
+                if entry_point:
+                    self.load_widget_entry_point(entry_point)
+                else:
+                    self.load_widget_class(widget_path, widget_class)
+            except Exception as e:
+                logging.warning(f"Failed to prefetch widget {widget_name}: {e}")
+            yield entry_point or widget_path
+
     def create_widgets_for_location(self, location: str, 
                                   on_widget_created: Optional[Callable[[QtWidgets.QWidget, str, Dict], None]] = None) -> List[QtWidgets.QWidget]:
         """Create all widgets for a specific location with a callback for customization.
@@ -148,35 +338,133 @@ class WidgetCreationService:
         Returns:
             List[QtWidgets.QWidget]: List of created widget instances
         """
-        widgets = []
-        widget_configs = self.get_widgets_for_location(location)
-        
-        for priority, widget_name, widget_config in widget_configs:
+        return self.create_widget_instances(self.get_widget_instances(location), on_widget_created)
+
+    def get_widget_instances(self, location: str) -> List[Tuple[str, Dict]]:
+        """Get the widget configurations of a location with ``repeat`` and ``matrix`` expanded.
+
+        Args:
+            location (str): Location name to get widgets for
+
+        Returns:
+            List[Tuple[str, Dict]]: Name and configuration of each instance, in priority order
+        """
+        instances = []
+        for priority, widget_name, widget_config in self.get_widgets_for_location(location):
             try:
-                widget_path = widget_config.get('path', '')
-                widget_class = widget_config.get('class', '')
-                
-                if not widget_path or not widget_class:
-                    continue
-                
-                params = widget_config.get('params', {})
-                strategy = widget_config.get('strategy')
-                
-                widget = self.create_widget(widget_path, widget_class, params, strategy)
-                if widget:
-                    if on_widget_created:
-                        on_widget_created(widget, widget_name, widget_config)
-                    widgets.append(widget)
-                    logging.info(f"Successfully created widget: {widget_class}")
-                else:
-                    logging.error(f"Failed to create widget: {widget_class}")
-                    
+                instances.extend(expand_widget_config(widget_name, widget_config))
             except Exception as e:
-                logging.error(f"Error creating widget {widget_name}: {e}")
+                logging.error(f"Error expanding widget {widget_name}: {e}")
+        return instances
+
+    def create_widget_instances(self, instances: List[Tuple[str, Dict]],
+                                on_widget_created: Optional[Callable[[QtWidgets.QWidget, str, Dict], None]] = None) -> List[QtWidgets.QWidget]:
+        """Create widgets from expanded instances, see ``get_widget_instances``.
+
+        Consecutive instances of the same class are created in one batch.
+
+        Args:
+            instances (List[Tuple[str, Dict]]): Name and configuration of each instance
+            on_widget_created (Optional[Callable[[QtWidgets.QWidget, str, Dict], None]]): Optional callback
+                called after each widget is created, as in ``create_widgets_for_location``
+
+        Returns:
+            List[QtWidgets.QWidget]: List of created widget instances
+        """
+        widgets = []
+        for (widget_path, widget_class, entry_point, strategy), batch in itertools.groupby(instances, key=widget_batch_key):
+            if not entry_point and (not widget_path or not widget_class):
+                continue
+
+            batch = list(batch)
+            params_list = [widget_config.get('params', {}) for widget_name, widget_config in batch]
+            created = self.create_widgets(widget_path, widget_class, params_list, strategy, entry_point)
+            widget_class = widget_class or entry_point
+
+            for (widget_name, widget_config), widget in zip(batch, created):
+                try:
+                    if widget:
+                        if on_widget_created:
+                            on_widget_created(widget, widget_name, widget_config)
+                        widgets.append(widget)
+                        logging.info(f"Successfully created widget: {widget_class}")
+                    else:
+                        logging.error(f"Failed to create widget: {widget_class}")
+
+                except Exception as e:
+                    logging.error(f"Error creating widget {widget_name}: {e}")
                 
         return widgets
 
 
+def widget_batch_key(instance: Tuple[str, Dict]) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """Key under which consecutive widget instances are created in one batch."""
+    widget_config = instance[1]
+    return (widget_config.get('path', ''), widget_config.get('class', ''),
+            widget_config.get('entry_point'), widget_config.get('strategy'))
+
+
+def expand_widget_config(widget_name: str, widget_config: Dict) -> List[Tuple[str, Dict]]:
+    """Expand the ``repeat`` and ``matrix`` fields of a widget config into one config per instance.
+
+    ``matrix`` maps parameter names to lists of values; one instance is created for
+    every combination, merged over ``params``. ``repeat`` creates each combination
+    that many times. Expanded instances are named ``<widget_name>_<index>``.
+
+    Args:
+        widget_name (str): Name of the widget from config
+        widget_config (Dict): Configuration dictionary for the widget
+
+    Returns:
+        List[Tuple[str, Dict]]: Name and configuration of each instance
+
+    Raises:
+        ValueError: If ``repeat`` is not a non-negative integer or ``matrix`` is not a mapping
+    """
+    repeat = widget_config.get('repeat', 1)
+    matrix = widget_config.get('matrix') or {}
+    if isinstance(repeat, bool) or not isinstance(repeat, int) or repeat < 0:
+        raise ValueError(f"'repeat' must be a non-negative integer, got {repeat!r}")
+    if not isinstance(matrix, dict):
+        raise ValueError(f"'matrix' must be a mapping, got {type(matrix).__name__}")
+    if repeat == 1 and not matrix:
+        return [(widget_name, widget_config)]
+
+    base_params = widget_config.get('params') or {}
+    keys = list(matrix)
+    values = [v if isinstance(v, list) else [v] for v in matrix.values()]
+
+    instances = []
+    for combination in itertools.product(*values):
+        params = dict(base_params)
+        params.update(zip(keys, combination))
+        for _ in range(repeat):
+            instance_config = {k: v for k, v in widget_config.items() if k not in ('repeat', 'matrix')}
+            instance_config['params'] = dict(params)
+            instances.append((f"{widget_name}_{len(instances)}", instance_config))
+    return instances
+
+def load_module_from_path(module_path: str, module_name: str):
+    """Execute a module from a file path without caching it.
+
+    Args:
+        module_path (str): Path to the module file
+        module_name (str): Name to give the module
+
+    Returns:
+        The loaded module
+    """
+    if not os.path.exists(module_path):
+        raise FileNotFoundError(f"Could not find module {module_path}")
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if not spec or not spec.loader:
+        raise ImportError(f"Failed to load spec for {module_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 def load_config(config_path) -> Dict:
     """Load widget configuration from YAML file."""
     try:
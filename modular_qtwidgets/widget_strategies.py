@@ -1,6 +1,7 @@
 """Widget creation strategies."""
 
-from typing import Type, Dict, Any
+import logging
+from typing import Type, Dict, Any, List
 from PySide6 import QtWidgets
 
 class WidgetCreationStrategy:
@@ -29,6 +30,29 @@ class WidgetCreationStrategy:
         """
         raise NotImplementedError()
 
+    def create_widgets(self, widget_class: Type, params_list: List[Dict[str, Any]]) -> List[QtWidgets.QWidget]:
+        """Create several instances of the same widget class.
+
+        Override this to do per-class setup once for the whole batch.
+        The default implementation calls ``create_widget`` for each entry.
+        
+        Args:
+            widget_class (Type): Widget class to create
+            params_list (List[Dict[str, Any]]): Parameters of each widget
+            
+        Returns:
+            List[QtWidgets.QWidget]: Created widget instances, in the order of params_list,
+                None where creation failed
+        """
+        widgets = []
+        for params in params_list:
+            try:
+                widgets.append(self.create_widget(widget_class, params))
+            except Exception as e:
+                logging.error(f"Error creating widget {widget_class.__name__}: {e}")
+                widgets.append(None)
+        return widgets
+
 class DefaultWidgetStrategy(WidgetCreationStrategy):
     """Strategy for creating QWidget instances."""
     
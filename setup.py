@@ -12,6 +12,8 @@ setup(
     install_requires=[
         "PySide6>=6.0.0",
         "PyYAML>=5.1",
+        # Entry point discovery in plugins.py; part of the standard library from 3.8
+        'importlib_metadata; python_version<"3.8"',
     ],
     python_requires=">=3.7",
     extras_require={
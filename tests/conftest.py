@@ -2,6 +2,18 @@ import pytest
 import os
 from PySide6.QtWidgets import QApplication
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache(tmp_path_factory):
+    """Keep caches written during tests out of the user's home directory."""
+    cache_dir = str(tmp_path_factory.mktemp("cache"))
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = cache_dir
+    yield cache_dir
+    if previous is None:
+        os.environ.pop("XDG_CACHE_HOME", None)
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
+
 @pytest.fixture(scope="session")
 def qapp():
     """Create a QApplication instance for the entire test session."""
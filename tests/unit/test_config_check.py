@@ -0,0 +1,114 @@
+import os
+import pytest
+import yaml
+from modular_qtwidgets.config_check import validate_config, check_config, main
+from modular_qtwidgets.plugins import PluginIndex
+
+@pytest.fixture
+def config_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+
+@pytest.fixture
+def config(config_path):
+    with open(config_path, "r") as f:
+        return yaml.safe_load(f)
+
+@pytest.fixture
+def plugin_index(tmp_path):
+    return PluginIndex(str(tmp_path / "entry_points.json"))
+
+def write_config(tmp_path, config):
+    path = str(tmp_path / "config.yaml")
+    with open(path, "w") as f:
+        yaml.dump(config, f)
+    return path
+
+def test_validate_valid_config(config):
+    """测试有效配置的结构校验"""
+    assert validate_config(config) == []
+
+def test_validate_reports_schema_errors(config):
+    """测试结构错误和未注册的策略"""
+    widget = config["widget_system"]["groups"]["test_group"]["widgets"]["test_widget"]
+    del widget["class"]
+    widget["priority"] = "high"
+    widget["strategy"] = "MissingStrategy"
+
+    issues = validate_config(config)
+    messages = [(level, where) for level, where, message in issues]
+    assert messages.count(("error", "test_group/test_widget")) == 2
+    assert ("warning", "test_group/test_widget") in messages
+    assert validate_config({})[0][0] == "error"
+
+def test_validate_reports_malformed_sections(config):
+    """测试格式错误的配置被报告而不是抛出异常"""
+    assert validate_config([1, 2])[0][:2] == ("error", "widget_system")
+
+    config["widget_system"]["config"] = ["discover_plugins"]
+    config["widget_system"]["groups"]["list_group"] = [1, 2]
+    del config["widget_system"]["strategies"]
+    errors = {where for level, where, message in validate_config(config) if level == "error"}
+    assert errors == {"config", "strategies", "list_group"}
+
+def test_validate_uses_runtime_expansion_rules(config):
+    """测试 repeat 和 matrix 使用与运行时相同的规则"""
+    widget = config["widget_system"]["groups"]["test_group"]["widgets"]["test_widget"]
+    widget["repeat"] = True
+    assert [(level, where) for level, where, message in validate_config(config)] == [
+        ("error", "test_group/test_widget")]
+
+    widget["repeat"] = 2
+    widget["matrix"] = ["a"]
+    assert [(level, where) for level, where, message in validate_config(config)] == [
+        ("error", "test_group/test_widget")]
+
+def test_check_config_passes(config_path, plugin_index):
+    """测试有效配置通过导入检查"""
+    assert check_config(config_path, construct=True, jobs=2, plugin_index=plugin_index) == []
+
+def test_construct_always_offscreen(config_path, plugin_index, monkeypatch):
+    """测试即使调用方选择了其他平台，构造检查也在 offscreen 平台进行"""
+    monkeypatch.setenv("QT_QPA_PLATFORM", "xcb")
+    assert check_config(config_path, construct=True, jobs=1, plugin_index=plugin_index) == []
+
+def test_check_config_reports_import_errors(tmp_path, config, plugin_index):
+    """测试缺失类和构造失败在子进程中被发现"""
+    widgets = config["widget_system"]["groups"]["test_group"]["widgets"]
+    widgets["missing_class"] = dict(widgets["test_widget"], **{"class": "MissingWidget"})
+    widgets["bad_params"] = dict(widgets["test_widget"], params={"invalid_param": 1})
+    path = write_config(tmp_path, config)
+
+    errors = {where for level, where, message in check_config(path, jobs=2, plugin_index=plugin_index) if level == "error"}
+    assert errors == {"test_group/missing_class"}
+
+    errors = {where for level, where, message in check_config(path, construct=True, jobs=2, plugin_index=plugin_index) if level == "error"}
+    assert errors == {"test_group/missing_class", "test_group/bad_params"}
+
+def test_main_exit_code(tmp_path, config, config_path, capsys):
+    """测试命令行返回值"""
+    assert main(["check", config_path]) == 0
+
+    config["widget_system"]["strategies"][0]["path"] = "missing.py"
+    assert main(["check", write_config(tmp_path, config)]) == 1
+    assert "Strategy module not found" in capsys.readouterr().out
+
+def test_crashing_module_is_isolated(tmp_path, config, plugin_index):
+    """测试导致工作进程退出的模块只报告在它自己身上"""
+    widgets = config["widget_system"]["groups"]["test_group"]["widgets"]
+    template = widgets.pop("test_widget")
+    for i in range(8):
+        path = tmp_path / f"widget_{i}.py"
+        crash = "import os\nos._exit(3)\n" if i == 5 else ""
+        path.write_text(crash + "from PySide6.QtWidgets import QWidget\n\nclass W(QWidget):\n    pass\n")
+        widgets[f"w{i}"] = dict(template, path=str(path), **{"class": "W", "params": {}})
+    path = write_config(tmp_path, config)
+
+    issues = check_config(path, jobs=3, plugin_index=plugin_index)
+    assert [(level, where) for level, where, message in issues] == [("error", "test_group/w5")]
+    assert "crashed" in issues[0][2]
+
+def test_missing_strategies_is_reported(tmp_path, config, plugin_index):
+    """测试缺少 strategies 时报告错误而不启动工作进程"""
+    del config["widget_system"]["strategies"]
+    issues = check_config(write_config(tmp_path, config), plugin_index=plugin_index)
+    assert [issue for issue in issues if issue[0] == "error"] == [("error", "strategies", "Missing 'strategies' list")]
@@ -0,0 +1,51 @@
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QWidget, QLabel
+from modular_qtwidgets.event_tracking import SubtreeEventFilter
+
+def send(widget):
+    QApplication.sendEvent(widget, QEvent(QEvent.User))
+
+class RecordingFilter(SubtreeEventFilter):
+    def __init__(self, include_children=True):
+        super().__init__(include_children)
+        self.events = []
+
+    def tracked_event(self, obj, key, event):
+        if event.type() == QEvent.User:
+            self.events.append((key, obj))
+
+def test_tracks_subtree_under_key(qapp):
+    """测试子组件的事件按父组件的键上报"""
+    tracker = RecordingFilter()
+    widget = QWidget()
+    existing = QLabel("existing", widget)
+    tracker.track(widget, "a")
+
+    late = QLabel("late", widget)
+    late.ensurePolished()
+    send(existing)
+    send(late)
+    assert ("a", existing) in tracker.events
+    assert ("a", late) in tracker.events
+
+def test_without_children(qapp):
+    """测试关闭子组件跟踪"""
+    tracker = RecordingFilter(include_children=False)
+    widget = QWidget()
+    child = QLabel("child", widget)
+    tracker.track(widget, "a")
+    send(child)
+    send(widget)
+    assert tracker.events == [("a", widget)]
+
+def test_untrack_by_key(qapp):
+    """测试按键停止跟踪"""
+    tracker = RecordingFilter()
+    first, second = QWidget(), QWidget()
+    tracker.track(first, "a")
+    tracker.track(second, "b")
+
+    tracker.untrack("a")
+    send(first)
+    send(second)
+    assert tracker.events == [("b", second)]
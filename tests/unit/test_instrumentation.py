@@ -0,0 +1,123 @@
+import os
+import json
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QListWidget
+from modular_qtwidgets.instrumentation import WidgetInstrumentation
+from modular_qtwidgets.location_host import LocationHostWidget
+
+@pytest.fixture
+def config_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+
+def test_records_resize_and_paint(qapp):
+    """测试记录尺寸变化和绘制"""
+    instrumentation = WidgetInstrumentation()
+    widget = QWidget()
+    layout = QVBoxLayout(widget)
+    layout.addWidget(QLabel("label"))
+
+    instrumentation.attach(widget, "test_group", "test_widget")
+    widget.resize(200, 100)
+    widget.show()
+    qapp.processEvents()
+    widget.repaint()
+    qapp.processEvents()
+
+    stats = instrumentation.get_stats("test_group")[0]
+    assert stats["location"] == "test_group"
+    assert stats["widget_name"] == "test_widget"
+    assert stats["resizes"] > 0
+    assert stats["paints"] > 0
+    assert stats["paint_time_ms"] >= stats["max_paint_ms"] > 0
+    assert instrumentation.get_stats("other_group") == []
+
+def dark_pixels(widget):
+    image = widget.grab().toImage()
+    return sum(1 for x in range(image.width()) for y in range(image.height())
+               if QColor(image.pixel(x, y)).lightness() < 100)
+
+def test_does_not_change_rendering(qapp):
+    """测试挂载后滚动区域控件的内容仍然正常绘制"""
+    def make_list():
+        widget = QListWidget()
+        widget.addItems([f"item {i}" for i in range(20)])
+        widget.resize(200, 200)
+        return widget
+
+    plain = make_list()
+    plain.show()
+    qapp.processEvents()
+
+    instrumentation = WidgetInstrumentation()
+    instrumented = make_list()
+    instrumentation.attach(instrumented, "test_group", "test_widget")
+    instrumented.show()
+    qapp.processEvents()
+
+    assert dark_pixels(plain) > 0
+    assert dark_pixels(instrumented) == dark_pixels(plain)
+    assert instrumentation.get_stats()[0]["paints"] > 0
+
+def test_tracks_children_added_later(qapp):
+    """测试后续添加的子组件也被统计"""
+    instrumentation = WidgetInstrumentation()
+    widget = QWidget()
+    instrumentation.attach(widget, "test_group", "test_widget")
+
+    label = QLabel("late", widget)
+    label.ensurePolished()
+    assert label in instrumentation._targets
+
+def test_reset_and_dump(qapp, tmp_path):
+    """测试重置和导出"""
+    instrumentation = WidgetInstrumentation()
+    widget = QWidget()
+    instrumentation.attach(widget, "test_group", "test_widget")
+    widget.resize(100, 100)
+    widget.show()
+    qapp.processEvents()
+
+    dump_path = str(tmp_path / "stats.json")
+    data = json.loads(instrumentation.dump(dump_path))
+    assert data[0]["events"] > 0
+    with open(dump_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == data
+
+    instrumentation.reset()
+    assert instrumentation.get_stats()[0]["events"] == 0
+
+    instrumentation.detach_all()
+    widget.resize(150, 150)
+    assert instrumentation.get_stats()[0]["resizes"] == 0
+
+def test_application_filter_removed_with_last_widget(qapp):
+    """测试最后一个组件被销毁后移除全局事件过滤器"""
+    instrumentation = WidgetInstrumentation()
+    first, second = QWidget(), QWidget()
+    QLabel("child", second)
+    instrumentation.attach(first, "test_group", "first")
+    instrumentation.attach(second, "test_group", "second")
+    assert instrumentation._paint_clock._installed
+
+    instrumentation.untrack(instrumentation._targets[first])
+    assert instrumentation._paint_clock._installed
+
+    second.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert not instrumentation._targets
+    assert not instrumentation._paint_clock._installed
+
+    instrumentation.attach(first, "test_group", "first")
+    assert instrumentation._paint_clock._installed
+
+def test_host_attaches_created_widgets(qapp, config_path):
+    """测试宿主控件挂载统计"""
+    instrumentation = WidgetInstrumentation()
+    host = LocationHostWidget(config_path, "test_group", instrumentation=instrumentation)
+    host.show()
+    qapp.processEvents()
+
+    names = [s["widget_name"] for s in instrumentation.get_stats("test_group")]
+    assert names == ["test_widget"]
@@ -0,0 +1,49 @@
+import os
+import pytest
+from PySide6.QtWidgets import QWidget
+from modular_qtwidgets.location_host import LocationHostWidget, IdlePrefetcher
+
+@pytest.fixture
+def config_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+
+def test_host_builds_on_first_show(qapp, config_path):
+    """测试首次显示时才创建组件"""
+    host = LocationHostWidget(config_path, "test_group")
+    assert not host.is_built
+    assert len(host.item_widgets) == 0
+
+    host.show()
+    assert host.is_built
+    assert len(host.item_widgets) == 1
+    assert isinstance(host.item_widgets[0], QWidget)
+
+    host.hide()
+    host.show()
+    assert len(host.item_widgets) == 1
+
+def test_prefetch_loads_modules_without_building(qapp, config_path):
+    """测试预取只加载模块而不创建组件"""
+    host = LocationHostWidget(config_path, "test_group")
+    steps = list(host.iter_prefetch())
+
+    assert steps[0] == config_path
+    assert "tests/fixtures/test_widget.py" in steps
+    assert not host.is_built
+    assert os.path.abspath("tests/fixtures/test_widget.py") in host.get_service()._modules
+
+def test_idle_prefetcher_drains_queue(qapp, config_path):
+    """测试空闲预取会处理所有排队的位置"""
+    hosts = [LocationHostWidget(config_path, "test_group") for _ in range(3)]
+    prefetcher = IdlePrefetcher(budget_ms=1.0)
+    for host in hosts:
+        prefetcher.add_host(host)
+
+    for _ in range(100):
+        if not prefetcher.has_pending():
+            break
+        qapp.processEvents()
+
+    assert not prefetcher.has_pending()
+    assert all(host._service is not None for host in hosts)
+    assert not any(host.is_built for host in hosts)
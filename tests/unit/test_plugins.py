@@ -0,0 +1,129 @@
+import os
+import sys
+import pytest
+import yaml
+from modular_qtwidgets import plugins
+from modular_qtwidgets.plugins import PluginIndex, STRATEGY_GROUP, WIDGET_GROUP
+from modular_qtwidgets.widget_loader import WidgetCreationService
+from modular_qtwidgets.config_check import validate_config
+
+PLUGIN_MODULE = '''
+from PySide6.QtWidgets import QLabel
+
+class PluginStrategy:
+    def can_handle(self, widget_class):
+        return getattr(widget_class, "from_plugin", False)
+
+    def create_widget(self, widget_class, params):
+        return widget_class(**params)
+
+class PluginLabel(QLabel):
+    from_plugin = True
+'''
+
+ENTRY_POINTS = f'''[{STRATEGY_GROUP}]
+plugin_strategy = fakeplug_module:PluginStrategy
+
+[{WIDGET_GROUP}]
+plugin_label = fakeplug_module:PluginLabel
+'''
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """在 sys.path 上创建一个带入口点的假发行包"""
+    site_dir = tmp_path / "site"
+    dist_info = site_dir / "fakeplug-0.1.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: fakeplug\nVersion: 0.1\n")
+    (dist_info / "entry_points.txt").write_text(ENTRY_POINTS)
+    (site_dir / "fakeplug_module.py").write_text(PLUGIN_MODULE)
+
+    sys.path.insert(0, str(site_dir))
+    yield site_dir
+    sys.path.remove(str(site_dir))
+    sys.modules.pop("fakeplug_module", None)
+
+@pytest.fixture
+def index(tmp_path, plugin_dir):
+    return PluginIndex(str(tmp_path / "cache" / "entry_points.json"))
+
+def test_discovers_entry_points_without_importing(index):
+    """测试发现入口点但不导入模块"""
+    assert index.get_entry_points(STRATEGY_GROUP)["plugin_strategy"] == "fakeplug_module:PluginStrategy"
+    assert "plugin_label" in index.get_entry_points(WIDGET_GROUP)
+    assert "fakeplug_module" not in sys.modules
+
+    assert index.load(WIDGET_GROUP, "plugin_label").__name__ == "PluginLabel"
+    with pytest.raises(LookupError):
+        index.load(WIDGET_GROUP, "missing")
+
+def test_cache_reused_until_environment_changes(index, plugin_dir, monkeypatch):
+    """测试缓存在环境不变时复用，环境变化后重新扫描"""
+    index.get_entry_points(STRATEGY_GROUP)
+
+    def fail():
+        raise AssertionError("entry points rescanned")
+
+    monkeypatch.setattr(plugins, "_scan_entry_points", fail)
+    cached = PluginIndex(index.cache_path)
+    assert "plugin_strategy" in cached.get_entry_points(STRATEGY_GROUP)
+
+    # 安装新的发行包会改变 sys.path 目录的 mtime
+    monkeypatch.undo()
+    other = plugin_dir / "otherplug-0.1.dist-info"
+    other.mkdir()
+    (other / "METADATA").write_text("Metadata-Version: 2.1\nName: otherplug\nVersion: 0.1\n")
+    (other / "entry_points.txt").write_text(f"[{WIDGET_GROUP}]\nother_label = fakeplug_module:PluginLabel\n")
+    os.utime(plugin_dir, ns=(0, os.stat(plugin_dir).st_mtime_ns + 1))
+
+    assert "other_label" in PluginIndex(index.cache_path).get_entry_points(WIDGET_GROUP)
+
+def test_unrelated_directory_changes_keep_cache(index, tmp_path, monkeypatch):
+    """测试 sys.path 中不含包元数据的目录变化不会触发重新扫描"""
+    scripts_dir = tmp_path / "scripts"
+    scripts_dir.mkdir()
+    monkeypatch.syspath_prepend(str(scripts_dir))
+    index.get_entry_points(STRATEGY_GROUP)
+
+    (scripts_dir / "tool.py").write_text("")
+    os.utime(scripts_dir, ns=(0, os.stat(scripts_dir).st_mtime_ns + 10 ** 9))
+
+    def fail():
+        raise AssertionError("entry points rescanned")
+
+    monkeypatch.setattr(plugins, "_scan_entry_points", fail)
+    assert "plugin_strategy" in PluginIndex(index.cache_path).get_entry_points(STRATEGY_GROUP)
+
+def test_service_uses_entry_points(qapp, tmp_path, index):
+    """测试服务通过入口点按需加载策略和控件"""
+    config = {"widget_system": {
+        "strategies": [{"name": "Configured", "entry_point": "plugin_strategy"}],
+        "groups": {"plugins": {"widgets": {
+            "label": {"entry_point": "plugin_label", "priority": 0, "params": {"text": "hi"}},
+        }}},
+    }}
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+
+    service = WidgetCreationService(str(path), plugin_index=index)
+    assert "fakeplug_module" not in sys.modules
+    assert validate_config(config, index) == []
+
+    created = []
+    service.create_widgets_for_location("plugins", lambda widget, name, widget_config: created.append((name, widget)))
+    assert [(name, widget.text()) for name, widget in created] == [("label", "hi")]
+    assert type(service.get_strategy(type(created[0][1]))).__name__ == "PluginStrategy"
+
+def test_discovered_strategy_used_by_can_handle(qapp, tmp_path, index):
+    """测试未配置的已安装策略在 can_handle 查找时加载"""
+    config = {"widget_system": {"strategies": [], "groups": {}}}
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+
+    service = WidgetCreationService(str(path), plugin_index=index)
+    label_class = index.load(WIDGET_GROUP, "plugin_label")
+    assert type(service.get_strategy(label_class)).__name__ == "PluginStrategy"
+
+    config["widget_system"]["config"] = {"discover_plugins": False}
+    path.write_text(yaml.dump(config))
+    assert WidgetCreationService(str(path), plugin_index=index).get_strategy(label_class) is None
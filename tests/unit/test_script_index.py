@@ -0,0 +1,168 @@
+import os
+import json
+import shutil
+import time
+import random
+import importlib.util
+import pytest
+
+SCRIPT_INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+                                 "example", "simple_tools", "widgets", "components", "script_index.py")
+
+@pytest.fixture(scope="module")
+def script_index():
+    spec = importlib.util.spec_from_file_location("script_index", SCRIPT_INDEX_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "scripts"
+    for path in ["a/x.py", "b/y.py", "b/c/z.py", "b/c/notes.txt"]:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("")
+    return root
+
+def bump_mtime(path):
+    """确保目录的 mtime 发生变化"""
+    mtime = os.stat(path).st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(mtime, mtime))
+
+def test_refresh_rescans_only_changed_dirs(script_index, tree, tmp_path):
+    """测试只重新扫描 mtime 变化的目录，并移除已删除的目录"""
+    index = script_index.ScriptIndex([str(tree)], str(tmp_path / "index.json"))
+    assert index.refresh()
+    assert sorted(os.path.relpath(p, tree) for p in index.paths()) == [
+        os.path.join("a", "x.py"), os.path.join("b", "c", "z.py"), os.path.join("b", "y.py")]
+
+    scanned = []
+    scan_dir = index._scan_dir
+    index._scan_dir = lambda path, mtime: scanned.append(path) or scan_dir(path, mtime)
+
+    assert not index.refresh()
+    assert scanned == []
+
+    (tree / "a" / "new.py").write_text("")
+    bump_mtime(tree / "a")
+    assert index.refresh()
+    assert scanned == [str(tree / "a")]
+    assert str(tree / "a" / "new.py") in index.paths()
+
+    scanned.clear()
+    shutil.rmtree(tree / "b" / "c")
+    bump_mtime(tree / "b")
+    assert index.refresh()
+    assert scanned == [str(tree / "b")]
+    assert str(tree / "b" / "c") not in index._dirs
+    assert str(tree / "b" / "c" / "z.py") not in index.paths()
+
+def test_save_and_load_round_trip(script_index, tree, tmp_path):
+    """测试索引保存后可以原样加载"""
+    index_path = str(tmp_path / "cache" / "index.json")
+    index = script_index.ScriptIndex([str(tree)], index_path)
+    index.refresh()
+    index.save()
+
+    loaded = script_index.ScriptIndex([str(tree)], index_path)
+    assert loaded.load()
+    assert sorted(loaded.paths()) == sorted(index.paths())
+    assert not loaded.refresh()
+
+    assert not script_index.ScriptIndex([str(tree)], index_path, extensions=(".txt",)).load()
+    with open(index_path, "w") as f:
+        json.dump({"version": 0}, f)
+    assert not script_index.ScriptIndex([str(tree)], index_path).load()
+    assert not script_index.ScriptIndex([str(tree)], str(tmp_path / "missing.json")).load()
+
+def test_search_tiers(script_index):
+    """测试文件名匹配优先于路径匹配和子序列匹配"""
+    search = script_index.ScriptSearch(["/x/export/run.py", "/x/tools/export.py", "/x/e/x/p/o/r/t.py"])
+    assert search.search("export") == ["/x/tools/export.py", "/x/export/run.py", "/x/e/x/p/o/r/t.py"]
+    assert search.search("export run") == ["/x/export/run.py"]
+    assert search.search("", limit=1) == ["/x/export/run.py"]
+
+def test_cached_search_matches_fresh_search(script_index):
+    """测试逐字输入时使用缓存的结果与全新搜索一致"""
+    rng = random.Random(0)
+    words = ["tools", "render", "export", "anim", "rig", "cache", "ui", "core"]
+    paths = ["/" + "/".join(rng.choice(words) + str(rng.randint(0, 9)) for _ in range(rng.randint(1, 4)))
+             + f"/{rng.choice(words)}_{rng.choice(words)}.py" for _ in range(2000)]
+
+    for limit in (5, 200, 5000):
+        for query in ["export_anim", "rigcache", "tools ui", "r e c", "zzz"]:
+            typing = script_index.ScriptSearch(paths)
+            for i in range(1, len(query) + 1):
+                assert typing.search(query[:i], limit) == script_index.ScriptSearch(paths).search(query[:i], limit)
+
+def test_prefiltered_chunked_search_matches_full_scan(script_index):
+    """测试按字符预筛选并分块扫描的结果与全量扫描一致"""
+    rng = random.Random(1)
+    words = ["tools", "render", "export", "anim", "rig", "cache", "ui", "core"]
+    paths = ["/" + "/".join(rng.choice(words) + str(rng.randint(0, 9)) for _ in range(rng.randint(1, 4)))
+             + f"/{rng.choice(words)}_{rng.choice(words)}.py" for _ in range(2000)]
+
+    full = script_index.ScriptSearch(paths)
+    full.prefilter_ratio = 0.0
+    filtered = script_index.ScriptSearch(paths)
+    filtered.prefilter_ratio = 1.0
+    filtered.scan_chunk = 16
+    for query in ["export_anim", "rig7 cache", "t", "zzz", "ui.py"]:
+        for limit in (5, 5000):
+            assert filtered.search(query, limit) == full.search(query, limit)
+            full._cached_query = filtered._cached_query = None
+
+def test_abandoned_search_keeps_cache_valid(script_index):
+    """测试中途放弃的搜索返回 None 且不影响后续结果"""
+    paths = [f"/x/tools{i}/export_{i}.py" for i in range(500)]
+    search = script_index.ScriptSearch(paths)
+    search.scan_chunk = 16
+    assert search.search("exp", 5000) is not None
+
+    assert search.search("tools", 5000, lambda: True) is None
+    assert search.search("export_1", 5000) == script_index.ScriptSearch(paths).search("export_1", 5000)
+
+def test_picker_searches_in_background(qapp, script_index, tree, tmp_path):
+    """测试选择对话框在后台线程中搜索并只显示当前文本的结果"""
+    spec = importlib.util.spec_from_file_location(
+        "script_picker", os.path.join(os.path.dirname(SCRIPT_INDEX_PATH), "script_picker.py"))
+    script_picker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script_picker)
+
+    indexer = script_index.ScriptIndexer([str(tree)], str(tmp_path / "index.json"))
+    indexer.refresh()
+    indexer.wait()
+    qapp.processEvents()
+
+    picker = script_picker.ScriptPicker(indexer, script_index.ScriptSearcher())
+    picker.filter_edit.setText("y")
+    picker.filter_edit.setText("z.py")
+    for _ in range(200):
+        qapp.processEvents()
+        if picker.shown_query == "z.py":
+            break
+        time.sleep(0.01)
+    assert [picker.result_list.item(i).text() for i in range(picker.result_list.count())] == [
+        str(tree / "b" / "c" / "z.py")]
+
+    # 结果尚未到达时确认，使用同步搜索的结果
+    picker.filter_edit.setText("x.py")
+    picker.accept()
+    assert picker.selected_path() == str(tree / "a" / "x.py")
+    assert not picker.searcher.isRunning()
+    indexer.stop()
+
+def test_launcher_loads_by_path(qapp, tree, tmp_path):
+    """测试启动器可以按文件路径加载，并通过同目录的模块使用索引"""
+    from modular_qtwidgets.widget_loader import WidgetCreationService
+
+    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+    service = WidgetCreationService(config_path)
+    launcher_path = os.path.join(os.path.dirname(SCRIPT_INDEX_PATH), "scripts_launcher.py")
+    launcher_class = service.load_widget_class(launcher_path, "ScriptsLauncher")
+
+    launcher = launcher_class("", script_roots=[str(tree)], index_path=str(tmp_path / "index.json"))
+    launcher.indexer.wait()
+    qapp.processEvents()
+    assert launcher.indexer.search.search("z.py") == [str(tree / "b" / "c" / "z.py")]
+    launcher.indexer.stop()
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import threading
+import pytest
+from modular_qtwidgets.service_registry import ServiceRegistry
+
+@pytest.fixture
+def config_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+
+@pytest.fixture
+def temp_config_path(config_path):
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, "config.yaml")
+    shutil.copy(config_path, path)
+    yield path
+    shutil.rmtree(temp_dir)
+
+def test_same_config_returns_same_service(config_path):
+    """测试相同配置返回同一个服务"""
+    registry = ServiceRegistry()
+    service = registry.get_service(config_path)
+    assert registry.get_service(config_path) is service
+    assert registry.get_service(os.path.relpath(config_path)) is service
+
+def test_changed_config_returns_new_service(temp_config_path):
+    """测试配置内容变化后返回新的服务"""
+    registry = ServiceRegistry()
+    service = registry.get_service(temp_config_path)
+
+    with open(temp_config_path, "a") as f:
+        f.write("\n# changed\n")
+
+    new_service = registry.get_service(temp_config_path)
+    assert new_service is not service
+    assert registry.get_service(temp_config_path) is new_service
+
+def test_invalidate(config_path):
+    """测试手动失效"""
+    registry = ServiceRegistry()
+    service = registry.get_service(config_path)
+    registry.invalidate(config_path)
+    assert registry.get_service(config_path) is not service
+
+    service = registry.get_service(config_path)
+    registry.invalidate()
+    assert registry.get_service(config_path) is not service
+
+def test_concurrent_access_creates_one_service(config_path):
+    """测试多线程访问只创建一个服务"""
+    registry = ServiceRegistry()
+    services = []
+
+    def worker():
+        services.append(registry.get_service(config_path))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(services) == 8
+    assert all(service is services[0] for service in services)
@@ -0,0 +1,127 @@
+import os
+import pytest
+import yaml
+from PySide6.QtCore import Qt, QEvent
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QApplication, QWidget, QLineEdit, QVBoxLayout
+from modular_qtwidgets.usage_profile import UsageProfile
+from modular_qtwidgets.location_host import LocationHostWidget
+
+@pytest.fixture
+def config_path():
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures", "test_config.yaml")
+
+@pytest.fixture
+def matrix_config_path(config_path, tmp_path):
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+    widget_config = config["widget_system"]["groups"]["test_group"]["widgets"]["test_widget"]
+    widget_config["matrix"] = {"test_param": ["a", "b", "c"]}
+    path = str(tmp_path / "config.yaml")
+    with open(path, "w") as f:
+        yaml.dump(config, f)
+    return path
+
+def press_key(widget):
+    QApplication.sendEvent(widget, QKeyEvent(QEvent.KeyPress, Qt.Key_A, Qt.NoModifier, "a"))
+
+def test_records_interaction_and_saves(qapp, tmp_path):
+    """测试记录交互并保存到磁盘"""
+    path = str(tmp_path / "profile" / "usage.json")
+    profile = UsageProfile(path)
+    widget = QWidget()
+    edit = QLineEdit(widget)
+    QVBoxLayout(widget).addWidget(edit)
+    profile.attach(widget, "test_group", "used")
+    profile.attach(QWidget(), "test_group", "unused")
+
+    widget.show()
+    press_key(edit)
+    profile.save()
+
+    loaded = UsageProfile(path)
+    assert loaded.get_score("test_group", "used") == 1.0
+    assert loaded.get_score("test_group", "unused") == 0.0
+
+def test_visible_widgets_score_less_than_used(qapp, tmp_path):
+    """测试仅可见的组件按 visible_weight 计分"""
+    path = str(tmp_path / "usage.json")
+    profile = UsageProfile(path, visible_weight=0.25)
+    used, seen = QWidget(), QWidget()
+    profile.attach(used, "test_group", "used")
+    profile.attach(seen, "test_group", "seen")
+    used.show()
+    seen.show()
+    press_key(used)
+    profile.save()
+
+    loaded = UsageProfile(path)
+    assert loaded.get_score("test_group", "used") == 1.0
+    assert loaded.get_score("test_group", "seen") == 0.25
+    assert "first_interaction_ms" not in loaded._locations["test_group"]["seen"]
+    assert loaded._locations["test_group"]["seen"]["first_visible_ms"] >= 0
+
+def test_unattached_widgets_decay(tmp_path):
+    """测试本次未创建的组件得分同样衰减"""
+    path = str(tmp_path / "usage.json")
+    profile = UsageProfile(path, decay=0.5, threshold=0.5)
+    profile._locations = {"loc": {"deferred": {"score": 0.8, "sessions": 3}}}
+    profile.save()
+
+    loaded = UsageProfile(path, decay=0.5, threshold=0.5)
+    assert loaded.get_score("loc", "deferred") == 0.4
+    eager, deferred = loaded.split("loc", [("deferred", {})])
+    assert eager == []
+
+def test_split_orders_by_score(tmp_path):
+    """测试按使用频率拆分"""
+    profile = UsageProfile(str(tmp_path / "usage.json"))
+    profile._locations = {"loc": {"b": {"score": 0.6}, "c": {"score": 2.0}, "d": {"score": 0.1}}}
+    instances = [(name, {}) for name in ["a", "b", "c", "d"]]
+
+    eager, deferred = profile.split("loc", instances)
+    assert [name for name, config in eager] == ["c", "b"]
+    assert [name for name, config in deferred] == ["a", "d"]
+
+    # 得分相同时，上次更早使用或显示的组件先创建
+    profile._locations = {"loc": {
+        "a": {"score": 1.0, "first_visible_ms": 50.0},
+        "b": {"score": 1.0, "first_interaction_ms": 900.0, "first_visible_ms": 60.0},
+        "c": {"score": 1.0, "first_visible_ms": 10.0},
+        "d": {"score": 1.0, "first_interaction_ms": 300.0, "first_visible_ms": 70.0},
+    }}
+    eager, deferred = profile.split("loc", instances)
+    assert [name for name, config in eager] == ["d", "b", "c", "a"]
+
+def test_unreadable_profile_is_ignored(tmp_path):
+    """测试损坏的配置文件被忽略"""
+    path = tmp_path / "usage.json"
+    path.write_text("not json")
+    assert UsageProfile(str(path)).get_score("loc", "a") == 0.0
+
+def test_host_builds_used_widgets_first(qapp, matrix_config_path, tmp_path):
+    """测试宿主先创建常用组件并保持配置顺序"""
+    profile = UsageProfile(str(tmp_path / "usage.json"))
+    profile._locations = {"test_group": {"test_widget_2": {"score": 1.0}}}
+    host = LocationHostWidget(matrix_config_path, "test_group", usage_profile=profile)
+
+    host.build()
+    assert [w.test_param for w in host.item_widgets] == ["c"]
+    assert host.has_deferred()
+
+    for _ in range(10):
+        if not host.has_deferred():
+            break
+        qapp.processEvents()
+
+    assert [w.test_param for w in host.item_widgets] == ["a", "b", "c"]
+    layout_params = [host.container_layout.itemAt(i).widget().test_param for i in range(3)]
+    assert layout_params == ["a", "b", "c"]
+
+def test_host_without_usage_data_builds_everything(qapp, matrix_config_path, tmp_path):
+    """测试没有使用数据时全部立即创建"""
+    profile = UsageProfile(str(tmp_path / "usage.json"))
+    host = LocationHostWidget(matrix_config_path, "test_group", usage_profile=profile)
+    host.build()
+    assert not host.has_deferred()
+    assert len(host.item_widgets) == 3
@@ -84,3 +84,68 @@ def test_disabled_widget(widget_service, config_path):
         assert len(widgets) == 0
     finally:
         os.unlink(temp_config_path)
+
+def test_repeat_and_matrix_expansion(config_path, qapp):
+    """测试 repeat 和 matrix 展开"""
+    import yaml
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_file:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f)
+
+        widget_config = config["widget_system"]["groups"]["test_group"]["widgets"]["test_widget"]
+        widget_config["repeat"] = 2
+        widget_config["matrix"] = {"test_param": ["a", "b"]}
+        yaml.dump(config, temp_file)
+        temp_config_path = temp_file.name
+
+    try:
+        service = WidgetCreationService(temp_config_path)
+        names = []
+        widgets = service.create_widgets_for_location(
+            "test_group", lambda widget, name, config: names.append(name))
+        assert [w.test_param for w in widgets] == ["a", "a", "b", "b"]
+        assert names == ["test_widget_0", "test_widget_1", "test_widget_2", "test_widget_3"]
+    finally:
+        os.unlink(temp_config_path)
+
+def test_invalid_expansion_skips_only_that_widget(config_path, qapp):
+    """测试无效的 repeat 或 matrix 只跳过该组件"""
+    import yaml
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_file:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f)
+
+        widgets = config["widget_system"]["groups"]["test_group"]["widgets"]
+        widgets["bad_repeat"] = dict(widgets["test_widget"], repeat="two")
+        widgets["bad_matrix"] = dict(widgets["test_widget"], matrix=["a", "b"])
+        yaml.dump(config, temp_file)
+        temp_config_path = temp_file.name
+
+    try:
+        service = WidgetCreationService(temp_config_path)
+        names = []
+        service.create_widgets_for_location("test_group", lambda widget, name, config: names.append(name))
+        assert names == ["test_widget"]
+    finally:
+        os.unlink(temp_config_path)
+
+def test_batch_creation_falls_back_to_single(widget_service, qapp):
+    """测试批量创建失败时逐个创建"""
+    class FailingBatchStrategy(WidgetCreationStrategy):
+        def can_handle(self, widget_class):
+            return True
+        def create_widget(self, widget_class, params=None):
+            return widget_class(**params)
+        def create_widgets(self, widget_class, params_list):
+            raise RuntimeError("batch failed")
+
+    widget_service.register_strategy("failing_batch", FailingBatchStrategy())
+    widgets = widget_service.create_widgets(
+        "tests/fixtures/test_widget.py", "TestWidget",
+        [{"test_param": "a"}, {"invalid_param": "b"}], "failing_batch")
+    assert widgets[0].test_param == "a"
+    assert widgets[1] is None
@@ -45,3 +45,24 @@ def test_create_widget_invalid_params(strategy):
     
     with pytest.raises(TypeError):
         strategy.create_widget(TestWidget, {"invalid_param": "value"})
+
+def test_create_widgets_batch(strategy):
+    """测试批量创建组件"""
+    class TestWidget(QWidget):
+        def __init__(self, test_param=None):
+            super().__init__()
+            self.test_param = test_param
+
+    widgets = strategy.create_widgets(TestWidget, [{"test_param": "a"}, {}, {"test_param": "c"}])
+    assert [w.test_param for w in widgets] == ["a", None, "c"]
+
+def test_create_widgets_isolates_failures(strategy):
+    """测试批量创建时单个失败不影响其他组件"""
+    class TestWidget(QWidget):
+        def __init__(self, test_param=None):
+            super().__init__()
+            self.test_param = test_param
+
+    widgets = strategy.create_widgets(TestWidget, [{"test_param": "a"}, {"invalid_param": "b"}])
+    assert widgets[0].test_param == "a"
+    assert widgets[1] is None